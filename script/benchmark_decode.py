@@ -0,0 +1,248 @@
+"""Benchmark decoding of the fixture corpus.
+
+Times the models and raw orjson over the device status, device page and
+device event fixtures, and over the largest multi-component devices one by
+one. Reports throughput, the peak memory allocated while decoding a payload
+and the memory still held once decoded. Results can be saved and compared
+against an earlier run:
+
+    python -m script.benchmark_decode --save before.json
+    python -m script.benchmark_decode --compare before.json
+"""
+
+import argparse
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+import gc
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+import orjson
+
+from pysmartthings import DeviceResponse, DeviceStatus
+from pysmartthings.models import DeviceEventRoot
+
+from .synthetic_account import generate_account
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+
+# Large multi-component devices, these dominate bulk status refreshes.
+LARGE_DEVICES = [
+    "da_ref_normal_01011",
+    "da_ref_normal_01001",
+    "da_ref_normal_000001",
+    "vd_stv_2023",
+    "vd_frame_2024",
+    "da_wm_wm_01011",
+    "da_ac_rac_000001",
+]
+
+
+@dataclass
+class Corpus:
+    """Payloads to decode and the number of items they contain."""
+
+    name: str
+    payloads: list[bytes]
+    items: int
+    unit: str
+
+
+@dataclass
+class Result:
+    """Benchmark result."""
+
+    us_per_payload: float
+    items_per_second: float
+    peak_bytes_per_payload: float
+    retained_blocks_per_payload: float
+    retained_bytes_per_payload: float
+
+
+def count_attributes(payloads: list[bytes]) -> int:
+    """Return the number of attributes in device status payloads."""
+    return sum(
+        len(attributes)
+        for payload in payloads
+        for component in orjson.loads(payload)["components"].values()  # pylint: disable=no-member
+        for attributes in component.values()
+    )
+
+
+def device_status_corpus() -> Corpus:
+    """Return the device status fixtures."""
+    payloads = [
+        path.read_bytes()
+        for path in sorted((FIXTURES / "device_status").glob("*.json"))
+        if path.stem != "fake"
+    ]
+    return Corpus("device_status", payloads, count_attributes(payloads), "attributes")
+
+
+def large_device_corpora() -> list[Corpus]:
+    """Return the status of each large multi-component device on its own."""
+    corpora = []
+    for fixture in LARGE_DEVICES:
+        payloads = [(FIXTURES / "device_status" / f"{fixture}.json").read_bytes()]
+        corpora.append(
+            Corpus(fixture, payloads, count_attributes(payloads), "attributes")
+        )
+    return corpora
+
+
+def device_page_corpus() -> Corpus:
+    """Return the device page fixtures."""
+    payloads = [
+        path.read_bytes() for path in sorted(FIXTURES.glob("devices_[0-9]*.json"))
+    ]
+    devices = sum(len(orjson.loads(payload)["items"]) for payload in payloads)  # pylint: disable=no-member
+    return Corpus("device_pages", payloads, devices, "devices")
+
+
+def synthetic_device_page(devices: int) -> Corpus:
+    """Return a single device page of a synthetic account of the given size."""
+    account = generate_account(devices, locations=max(1, devices // 250))
+    payload = orjson.dumps(account.device_page(page_size=devices))  # pylint: disable=no-member
+    return Corpus(f"device_page_{devices}", [payload], devices, "devices")
+
+
+def device_event_corpus() -> Corpus:
+    """Return a device event for every attribute in the device status fixtures."""
+    template = orjson.loads((FIXTURES / "event.json").read_bytes())  # pylint: disable=no-member
+    payloads = []
+    for path in sorted((FIXTURES / "device_status").glob("*.json")):
+        if path.stem == "fake":
+            continue
+        components = orjson.loads(path.read_bytes())["components"]  # pylint: disable=no-member
+        for component_id, capabilities in components.items():
+            for capability, attributes in capabilities.items():
+                for attribute, status in attributes.items():
+                    event = {
+                        **template["deviceEvent"],
+                        "componentId": component_id,
+                        "capability": capability,
+                        "attribute": attribute,
+                        "value": status.get("value"),
+                        "data": status.get("data") or {},
+                    }
+                    payloads.append(
+                        orjson.dumps({**template, "deviceEvent": event})  # pylint: disable=no-member
+                    )
+    return Corpus("device_events", payloads, len(payloads), "events")
+
+
+def measure(decode: Callable[[bytes], Any], corpus: Corpus, iterations: int) -> Result:
+    """Measure decoding of a corpus."""
+    best = float("inf")
+    for _ in range(iterations):
+        start = time.perf_counter()
+        for payload in corpus.payloads:
+            decode(payload)
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    peak = 0
+    for payload in corpus.payloads:
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        decode(payload)
+        peak += tracemalloc.get_traced_memory()[1] - current
+    before = tracemalloc.take_snapshot()
+    decoded = [decode(payload) for payload in corpus.payloads]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = after.compare_to(before, "filename")
+    del decoded
+    payloads = len(corpus.payloads)
+    return Result(
+        us_per_payload=best / payloads * 1_000_000,
+        items_per_second=corpus.items / best,
+        peak_bytes_per_payload=peak / payloads,
+        retained_blocks_per_payload=sum(stat.count_diff for stat in retained)
+        / payloads,
+        retained_bytes_per_payload=sum(stat.size_diff for stat in retained) / payloads,
+    )
+
+
+def run(iterations: int, devices: int) -> dict[str, dict[str, Any]]:
+    """Run the benchmark suite."""
+    statuses = device_status_corpus()
+    pages = device_page_corpus()
+    events = device_event_corpus()
+    benchmarks: list[tuple[str, Callable[[bytes], Any], Corpus]] = [
+        ("orjson.loads", orjson.loads, statuses),  # pylint: disable=no-member
+        ("DeviceStatus.from_json", DeviceStatus.from_json, statuses),
+        ("orjson.loads", orjson.loads, pages),  # pylint: disable=no-member
+        ("DeviceResponse.from_json", DeviceResponse.from_json, pages),
+        ("orjson.loads", orjson.loads, events),  # pylint: disable=no-member
+        ("DeviceEventRoot.from_json", DeviceEventRoot.from_json, events),
+    ]
+    benchmarks.extend(
+        ("DeviceStatus.from_json", DeviceStatus.from_json, corpus)
+        for corpus in large_device_corpora()
+    )
+    if devices:
+        synthetic = synthetic_device_page(devices)
+        benchmarks.append(
+            ("DeviceResponse.from_json", DeviceResponse.from_json, synthetic)
+        )
+    results: dict[str, dict[str, Any]] = {}
+    for name, decode, corpus in benchmarks:
+        result = measure(decode, corpus, iterations)
+        results[f"{name}[{corpus.name}]"] = {"unit": corpus.unit, **asdict(result)}
+    return results
+
+
+def report(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]] | None = None,
+) -> None:
+    """Print the results, compared to a baseline if given."""
+    print(
+        f"{'benchmark':<48} {'us/payload':>11} {'items/s':>22} "
+        f"{'peak bytes':>11} {'retained blocks':>16} {'retained bytes':>15}"
+    )
+    for name, result in results.items():
+        line = (
+            f"{name:<48} {result['us_per_payload']:>11.1f} "
+            f"{result['items_per_second']:>11.0f} {result['unit']:<10} "
+            f"{result['peak_bytes_per_payload']:>11.0f} "
+            f"{result['retained_blocks_per_payload']:>16.1f} "
+            f"{result['retained_bytes_per_payload']:>15.0f}"
+        )
+        if baseline and name in baseline:
+            previous = baseline[name]["us_per_payload"]
+            change = (result["us_per_payload"] - previous) / previous * 100
+            line += f" {change:>+7.1f}%"
+        print(line)
+
+
+def main() -> int:
+    """Run the script."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("-n", "--iterations", type=int, default=20)
+    parser.add_argument(
+        "-d",
+        "--devices",
+        type=int,
+        default=5000,
+        help="size of the synthetic device page, 0 to skip",
+    )
+    parser.add_argument("--save", type=Path, help="write the results to a file")
+    parser.add_argument("--compare", type=Path, help="compare against saved results")
+    args = parser.parse_args()
+    results = run(args.iterations, args.devices)
+    baseline = orjson.loads(args.compare.read_bytes()) if args.compare else None  # pylint: disable=no-member
+    report(results, baseline)
+    if args.save:
+        args.save.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))  # pylint: disable=no-member
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
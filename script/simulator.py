@@ -0,0 +1,343 @@
+"""Local stand-in for the SmartThings API to load test the client offline.
+
+Serves a synthetic account over plain HTTP: locations, rooms, paginated
+devices, device status, health and commands, scenes, plus subscriptions with a
+registration URL that streams synthetic device events over Server-Sent
+Events. Every request can be delayed and fail at a configurable rate.
+
+    python -m script.simulator --devices 5000 --locations 20 --event-rate 50
+
+and point the client at it with `SmartThings(base_url="http://127.0.0.1:8080")`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+from dataclasses import dataclass, field
+import random
+import sys
+import time
+from typing import TYPE_CHECKING, Any
+import uuid
+
+from aiohttp import web
+import orjson
+
+from .synthetic_account import SyntheticAccount, generate_account
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+@dataclass
+class Profile:
+    """Latency, error and event profile of the simulator."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    event_rate: float = 1.0
+    keepalive_interval: float = 15.0
+    page_size: int = 200
+
+
+@dataclass
+class Simulator:
+    """SmartThings API simulator."""
+
+    account: SyntheticAccount
+    profile: Profile = field(default_factory=Profile)
+    seed: int = 0
+    requests: int = 0
+    events: int = 0
+    subscriptions: dict[str, str] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Index the account."""
+        self._rng = random.Random(self.seed)  # noqa: S311
+        self._devices = {device["deviceId"]: device for device in self.account.devices}
+        self._locations = {
+            location["locationId"]: location for location in self.account.locations
+        }
+        self._rooms = {room["roomId"]: room for room in self.account.rooms}
+        self._scenes = {scene["sceneId"]: scene for scene in self.account.scenes}
+        self._base_url = ""
+
+    @property
+    def app(self) -> web.Application:
+        """Return the aiohttp application."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/v1/locations", self._locations_handler)
+        app.router.add_get("/v1/locations/{location_id}", self._location_handler)
+        app.router.add_get("/v1/locations/{location_id}/rooms", self._rooms_handler)
+        app.router.add_get(
+            "/v1/locations/{location_id}/rooms/{room_id}", self._room_handler
+        )
+        app.router.add_get("/v1/devices", self._devices_handler)
+        app.router.add_get("/v1/devices/{device_id}", self._device_handler)
+        app.router.add_get("/v1/devices/{device_id}/status", self._status_handler)
+        app.router.add_get("/v1/devices/{device_id}/health", self._health_handler)
+        app.router.add_post("/v1/devices/{device_id}/commands", self._command_handler)
+        app.router.add_get("/v1/scenes", self._scenes_handler)
+        app.router.add_post("/v1/scenes/{scene_id}/execute", self._execute_handler)
+        app.router.add_post("/subscriptions", self._subscribe_handler)
+        app.router.add_delete(
+            "/subscriptions/{subscription_id}", self._unsubscribe_handler
+        )
+        app.router.add_get("/sse/{subscription_id}", self._sse_handler)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> web.AppRunner:
+        """Start serving and return the runner, `base_url` is set afterwards."""
+        runner = web.AppRunner(self.app)
+        await runner.setup()
+        site = web.TCPSite(runner, host, port)
+        await site.start()
+        bound = runner.addresses[0]
+        self._base_url = f"http://{bound[0]}:{bound[1]}"
+        return runner
+
+    @property
+    def base_url(self) -> str:
+        """Return the URL the simulator is listening on."""
+        return self._base_url
+
+    @web.middleware
+    async def _middleware(
+        self,
+        request: web.Request,
+        handler: Callable[[web.Request], Awaitable[web.StreamResponse]],
+    ) -> web.StreamResponse:
+        """Apply the latency and error profile."""
+        self.requests += 1
+        delay = self.profile.latency + self._rng.uniform(0, self.profile.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self._rng.random() < self.profile.error_rate:
+            return self._json(
+                {
+                    "requestId": str(uuid.uuid4()),
+                    "error": {
+                        "code": "SimulatedError",
+                        "message": "Simulated error",
+                        "details": [],
+                    },
+                },
+                status=self.profile.error_status,
+            )
+        return await handler(request)
+
+    @staticmethod
+    def _json(data: Any, status: int = 200) -> web.Response:
+        """Return a JSON response."""
+        return web.Response(
+            body=orjson.dumps(data),  # pylint: disable=no-member
+            status=status,
+            content_type="application/json",
+        )
+
+    def _device(self, request: web.Request) -> dict[str, Any]:
+        """Return the device of a request."""
+        try:
+            return self._devices[request.match_info["device_id"]]
+        except KeyError:
+            raise web.HTTPNotFound from None
+
+    async def _locations_handler(self, _: web.Request) -> web.Response:
+        return self._json(self.account.location_page())
+
+    async def _location_handler(self, request: web.Request) -> web.Response:
+        try:
+            return self._json(self._locations[request.match_info["location_id"]])
+        except KeyError:
+            raise web.HTTPNotFound from None
+
+    async def _rooms_handler(self, request: web.Request) -> web.Response:
+        return self._json(self.account.room_page(request.match_info["location_id"]))
+
+    async def _room_handler(self, request: web.Request) -> web.Response:
+        room = self._rooms.get(request.match_info["room_id"])
+        if room is None or room["locationId"] != request.match_info["location_id"]:
+            raise web.HTTPNotFound
+        return self._json(room)
+
+    async def _devices_handler(self, request: web.Request) -> web.Response:
+        page_size = int(request.query.get("max", self.profile.page_size))
+        page = int(request.query.get("page", 0))
+        return self._json(
+            self.account.device_page(page, page_size, base_url=self._base_url)
+        )
+
+    async def _device_handler(self, request: web.Request) -> web.Response:
+        return self._json(self._device(request))
+
+    async def _status_handler(self, request: web.Request) -> web.Response:
+        return self._json(self.account.statuses[self._device(request)["deviceId"]])
+
+    async def _health_handler(self, request: web.Request) -> web.Response:
+        return self._json(
+            {
+                "deviceId": self._device(request)["deviceId"],
+                "state": "ONLINE",
+                "lastUpdatedDate": "2025-04-28T11:43:31.600Z",
+            }
+        )
+
+    async def _command_handler(self, request: web.Request) -> web.Response:
+        self._device(request)
+        commands = orjson.loads(await request.read())["commands"]  # pylint: disable=no-member
+        return self._json(
+            {
+                "results": [
+                    {"id": str(uuid.uuid4()), "status": "ACCEPTED"} for _ in commands
+                ]
+            }
+        )
+
+    async def _scenes_handler(self, request: web.Request) -> web.Response:
+        return self._json(self.account.scene_page(request.query.get("locationId")))
+
+    async def _execute_handler(self, request: web.Request) -> web.Response:
+        if request.match_info["scene_id"] not in self._scenes:
+            raise web.HTTPNotFound
+        return self._json({"status": "success"})
+
+    async def _subscribe_handler(self, request: web.Request) -> web.Response:
+        body = orjson.loads(await request.read())  # pylint: disable=no-member
+        subscription_id = str(uuid.uuid4())
+        location_ids = body["subscriptionFilters"][0]["value"]
+        self.subscriptions[subscription_id] = location_ids[0]
+        return self._json(
+            {
+                "subscriptionId": subscription_id,
+                "registrationUrl": f"{self._base_url}/sse/{subscription_id}",
+                "name": body["name"],
+                "version": body["version"],
+                "subscriptionFilters": body["subscriptionFilters"],
+            }
+        )
+
+    async def _unsubscribe_handler(self, request: web.Request) -> web.Response:
+        self.subscriptions.pop(request.match_info["subscription_id"], None)
+        return self._json({})
+
+    async def _sse_handler(self, request: web.Request) -> web.StreamResponse:
+        subscription_id = request.match_info["subscription_id"]
+        if subscription_id not in self.subscriptions:
+            raise web.HTTPNotFound
+        location_id = self.subscriptions[subscription_id]
+        devices = [
+            device
+            for device in self.account.devices
+            if device["locationId"] == location_id
+        ] or self.account.devices
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        interval = 1 / self.profile.event_rate if self.profile.event_rate else None
+        # Clients going away mid-stream is the normal way for a stream to end.
+        with contextlib.suppress(ConnectionResetError):
+            last_keepalive = time.monotonic()
+            while subscription_id in self.subscriptions:
+                if interval is None:
+                    await asyncio.sleep(self.profile.keepalive_interval)
+                else:
+                    await asyncio.sleep(interval)
+                    if event := self._device_event(self._rng.choice(devices)):
+                        self.events += 1
+                        await response.write(
+                            b"event: DEVICE_EVENT\ndata: "
+                            + orjson.dumps(event)  # pylint: disable=no-member
+                            + b"\n\n"
+                        )
+                if time.monotonic() - last_keepalive >= self.profile.keepalive_interval:
+                    last_keepalive = time.monotonic()
+                    await response.write(b": keepalive\n\n")
+            await response.write(b"event: CONTROL_EVENT\ndata: goodbye\n\n")
+        return response
+
+    def _device_event(self, device: dict[str, Any]) -> dict[str, Any] | None:
+        """Return a device event for a random attribute of the device."""
+        attributes = [
+            (component_id, capability, attribute, status)
+            for component_id, capabilities in self.account.statuses[device["deviceId"]][
+                "components"
+            ].items()
+            for capability, statuses in capabilities.items()
+            for attribute, status in statuses.items()
+        ]
+        if not attributes:
+            return None
+        component_id, capability, attribute, status = self._rng.choice(attributes)
+        return {
+            "eventTime": int(time.time() * 1000),
+            "eventType": "DEVICE_EVENT",
+            "deviceEvent": {
+                "eventId": str(uuid.uuid4()),
+                "locationId": device["locationId"],
+                "ownerId": device["locationId"],
+                "ownerType": "LOCATION",
+                "deviceId": device["deviceId"],
+                "componentId": component_id,
+                "capability": capability,
+                "attribute": attribute,
+                "value": status.get("value"),
+                "valueType": "string",
+                "stateChange": True,
+                "data": status.get("data") or {},
+                "subscriptionName": "My Home Assistant sub",
+            },
+        }
+
+
+async def serve(simulator: Simulator, host: str, port: int) -> None:
+    """Serve until cancelled."""
+    runner = await simulator.start(host, port)
+    print(
+        f"Serving {len(simulator.account.devices)} devices on {simulator.base_url}",
+        flush=True,
+    )
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+def main() -> int:
+    """Run the script."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("-d", "--devices", type=int, default=1000)
+    parser.add_argument("-l", "--locations", type=int, default=1)
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--event-rate", type=float, default=1.0, help="events/s")
+    parser.add_argument("--page-size", type=int, default=200)
+    args = parser.parse_args()
+    simulator = Simulator(
+        generate_account(args.devices, args.locations, seed=args.seed),
+        Profile(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            event_rate=args.event_rate,
+            page_size=args.page_size,
+        ),
+        seed=args.seed,
+    )
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(simulator, args.host, args.port))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
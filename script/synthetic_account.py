@@ -0,0 +1,293 @@
+"""Generate synthetic SmartThings accounts from the fixtures.
+
+The device page and device status fixtures are used as templates to compose
+accounts of any size, with consistent ids between locations, rooms, hubs,
+devices and their status documents.
+
+    python -m script.synthetic_account --devices 5000 --locations 20 out/
+"""
+
+import argparse
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import itertools
+from pathlib import Path
+import random
+import sys
+from typing import Any
+import uuid
+
+import orjson
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+API_URL = "https://api.smartthings.com"
+
+
+def _load(path: Path) -> Any:
+    """Load a JSON file."""
+    return orjson.loads(path.read_bytes())  # pylint: disable=no-member
+
+
+def _copy(data: Any) -> Any:
+    """Return a deep copy of JSON data."""
+    return orjson.loads(orjson.dumps(data))  # pylint: disable=no-member
+
+
+@dataclass
+class Templates:
+    """Device and status templates taken from the fixtures."""
+
+    hubs: list[dict[str, Any]]
+    devices: list[dict[str, Any]]
+    capability_status: dict[str, dict[str, Any]]
+    location: dict[str, Any]
+    scenes: list[dict[str, Any]]
+
+    @classmethod
+    def load(cls) -> "Templates":
+        """Load the templates from the fixtures."""
+        items = [
+            item
+            for path in sorted(FIXTURES.glob("devices_[0-9]*.json"))
+            for item in _load(path)["items"]
+        ]
+        capability_status: dict[str, dict[str, Any]] = {}
+        for path in sorted((FIXTURES / "device_status").glob("*.json")):
+            if path.stem == "fake":
+                continue
+            for capabilities in _load(path)["components"].values():
+                for capability, attributes in capabilities.items():
+                    capability_status.setdefault(capability, attributes)
+        return cls(
+            hubs=[item for item in items if item["type"] == "HUB"],
+            devices=[item for item in items if item["type"] != "HUB"],
+            capability_status=capability_status,
+            location=_load(FIXTURES / "location.json"),
+            scenes=_load(FIXTURES / "scenes.json")["items"],
+        )
+
+
+@dataclass
+class SyntheticAccount:
+    """Synthetic account with raw API documents."""
+
+    locations: list[dict[str, Any]] = field(default_factory=list)
+    rooms: list[dict[str, Any]] = field(default_factory=list)
+    devices: list[dict[str, Any]] = field(default_factory=list)
+    statuses: dict[str, dict[str, Any]] = field(default_factory=dict)
+    scenes: list[dict[str, Any]] = field(default_factory=list)
+
+    def location_page(self) -> dict[str, Any]:
+        """Return the `v1/locations` document."""
+        return {
+            "items": [
+                {"locationId": location["locationId"], "name": location["name"]}
+                for location in self.locations
+            ],
+            "_links": None,
+        }
+
+    def room_page(self, location_id: str) -> dict[str, Any]:
+        """Return the `v1/locations/{id}/rooms` document."""
+        return {
+            "items": [room for room in self.rooms if room["locationId"] == location_id],
+            "_links": None,
+        }
+
+    def scene_page(self, location_id: str | None = None) -> dict[str, Any]:
+        """Return the `v1/scenes` document."""
+        return {
+            "items": [
+                scene
+                for scene in self.scenes
+                if location_id is None or scene["locationId"] == location_id
+            ],
+            "_links": None,
+        }
+
+    def device_page(
+        self, page: int = 0, page_size: int = 200, base_url: str = API_URL
+    ) -> dict[str, Any]:
+        """Return a page of the `v1/devices` document."""
+        start = page * page_size
+        links: dict[str, Any] = {}
+        if start + page_size < len(self.devices):
+            links["next"] = {
+                "href": f"{base_url}/v1/devices?max={page_size}&page={page + 1}"
+            }
+        return {"items": self.devices[start : start + page_size], "_links": links}
+
+    def device_pages(
+        self, page_size: int = 200, base_url: str = API_URL
+    ) -> list[dict[str, Any]]:
+        """Return all pages of the `v1/devices` document."""
+        pages = max(1, -(-len(self.devices) // page_size))
+        return [self.device_page(page, page_size, base_url) for page in range(pages)]
+
+
+@dataclass
+class _Site:
+    """Location of a synthetic account with its hub and rooms."""
+
+    location_id: str
+    hub_id: str
+    room_ids: list[str]
+
+
+def _add_location(
+    account: SyntheticAccount,
+    templates: Templates,
+    index: int,
+    rooms_per_location: int,
+    new_id: Callable[[], str],
+) -> _Site:
+    """Add a location with its rooms and hub."""
+    location_id = new_id()
+    account.locations.append(
+        {
+            **templates.location,
+            "locationId": location_id,
+            "name": f"Location {index + 1}",
+        }
+    )
+    room_ids = []
+    for room_index in range(rooms_per_location):
+        room_id = new_id()
+        room_ids.append(room_id)
+        account.rooms.append(
+            {
+                "roomId": room_id,
+                "locationId": location_id,
+                "name": f"Room {room_index + 1}",
+                "backgroundImage": None,
+            }
+        )
+    hub = _copy(templates.hubs[index % len(templates.hubs)])
+    hub.pop("childDevices", None)
+    hub.update(
+        deviceId=new_id(),
+        locationId=location_id,
+        roomId=room_ids[0] if room_ids else None,
+        label=f"Hub {index + 1}",
+    )
+    account.devices.append(hub)
+    return _Site(location_id, hub["deviceId"], room_ids)
+
+
+def _place_device(
+    device: dict[str, Any],
+    template: dict[str, Any],
+    site: _Site,
+    rng: random.Random,
+) -> None:
+    """Put a device in a room of a site and attach it to the hub if needed."""
+    if "roomId" in template and site.room_ids:
+        device["roomId"] = rng.choice(site.room_ids)
+    if "parentDeviceId" in template:
+        device["parentDeviceId"] = site.hub_id
+    for protocol in ("zigbee", "zwave", "matter"):
+        if "hubId" in device.get(protocol, {}):
+            device[protocol]["hubId"] = site.hub_id
+
+
+def _device_status(device: dict[str, Any], templates: Templates) -> dict[str, Any]:
+    """Return a status document for every capability of a device."""
+    return {
+        "components": {
+            component["id"]: {
+                capability["id"]: _copy(
+                    templates.capability_status.get(capability["id"], {})
+                )
+                for capability in component["capabilities"]
+            }
+            for component in device["components"]
+        }
+    }
+
+
+def generate_account(
+    devices: int,
+    locations: int = 1,
+    rooms_per_location: int = 8,
+    seed: int = 0,
+    templates: Templates | None = None,
+) -> SyntheticAccount:
+    """Generate an account with the given number of devices.
+
+    Every location gets a hub, which counts towards the number of devices.
+    Devices that had a parent in their template are attached to the hub of
+    their location.
+    """
+    templates = templates or Templates.load()
+    rng = random.Random(seed)  # noqa: S311
+
+    def new_id() -> str:
+        return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+    account = SyntheticAccount()
+    sites = [
+        _add_location(account, templates, index, rooms_per_location, new_id)
+        for index in range(locations)
+    ]
+    for index, site in zip(range(devices - len(sites)), itertools.cycle(sites)):
+        template = templates.devices[index % len(templates.devices)]
+        device = _copy(template)
+        device.pop("childDevices", None)
+        device.update(
+            deviceId=new_id(),
+            locationId=site.location_id,
+            label=f"{template['label']} {index + 1}",
+        )
+        _place_device(device, template, site, rng)
+        account.devices.append(device)
+
+    for device in account.devices:
+        account.statuses[device["deviceId"]] = _device_status(device, templates)
+    for site in sites:
+        account.scenes.extend(
+            {**scene, "sceneId": new_id(), "locationId": site.location_id}
+            for scene in templates.scenes
+        )
+    return account
+
+
+def main() -> int:
+    """Run the script."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("output", type=Path)
+    parser.add_argument("-d", "--devices", type=int, default=1000)
+    parser.add_argument("-l", "--locations", type=int, default=1)
+    parser.add_argument("-r", "--rooms", type=int, default=8)
+    parser.add_argument("-p", "--page-size", type=int, default=200)
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    args = parser.parse_args()
+    account = generate_account(args.devices, args.locations, args.rooms, args.seed)
+    (args.output / "device_status").mkdir(parents=True, exist_ok=True)
+    (args.output / "locations.json").write_bytes(
+        orjson.dumps(account.location_page())  # pylint: disable=no-member
+    )
+    (args.output / "rooms.json").write_bytes(
+        orjson.dumps({"items": account.rooms, "_links": None})  # pylint: disable=no-member
+    )
+    (args.output / "scenes.json").write_bytes(
+        orjson.dumps(account.scene_page())  # pylint: disable=no-member
+    )
+    for page, document in enumerate(account.device_pages(args.page_size)):
+        (args.output / f"devices_{page}.json").write_bytes(
+            orjson.dumps(document)  # pylint: disable=no-member
+        )
+    for device_id, status in account.statuses.items():
+        (args.output / "device_status" / f"{device_id}.json").write_bytes(
+            orjson.dumps(status)  # pylint: disable=no-member
+        )
+    print(
+        f"Generated {len(account.devices)} devices in {len(account.locations)} "
+        f"locations to {args.output}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@
 from .attribute import CAPABILITY_ATTRIBUTES, Attribute
 from .capability import Capability
 from .command import CAPABILITY_COMMANDS, Command
+from .event_log import EventLog
 from .exceptions import (
     SmartThingsAuthenticationFailedError,
     SmartThingsCommandError,
@@ -13,6 +14,8 @@ from .exceptions import (
     SmartThingsRateLimitError,
     SmartThingsSinkError,
 )
+from .health import HealthIndex
+from .metrics import EventStreamStats, RequestMetrics
 from .models import (
     BaseLocation,
     CapabilityStatus,
@@ -24,17 +27,20 @@ from .models import (
     DeviceHealth,
     DeviceHealthEvent,
     DeviceHealthEventRoot,
+    DeviceLifecycleEvent,
     DeviceNetworkType,
     DeviceResponse,
     DeviceStatus,
     DeviceType,
     ErrorDetails,
     ErrorResponse,
+    HealthStatus,
     InstalledApp,
     Lifecycle,
     Location,
     LocationResponse,
     Room,
+    RoomMove,
     RoomResponse,
     Scene,
     SceneResponse,
@@ -42,6 +48,11 @@ from .models import (
     Subscription,
 )
 from .smartthings import SmartThings
+from .snapshot import Snapshot
+from .state import Condition, StateStore
+from .status_file import StatusFile
+from .stream import StreamRecorder, StreamReplayer
+from .topology import Topology
 
 __all__ = [
     "CAPABILITY_ATTRIBUTES",
@@ -54,22 +65,30 @@ __all__ = [
     "Command",
     "Component",
     "ComponentStatus",
+    "Condition",
     "Device",
     "DeviceEvent",
     "DeviceHealth",
     "DeviceHealthEvent",
     "DeviceHealthEventRoot",
+    "DeviceLifecycleEvent",
     "DeviceNetworkType",
     "DeviceResponse",
     "DeviceStatus",
     "DeviceType",
     "ErrorDetails",
     "ErrorResponse",
+    "EventLog",
+    "EventStreamStats",
+    "HealthIndex",
+    "HealthStatus",
     "InstalledApp",
     "Lifecycle",
     "Location",
     "LocationResponse",
+    "RequestMetrics",
     "Room",
+    "RoomMove",
     "RoomResponse",
     "Scene",
     "SceneResponse",
@@ -82,6 +101,12 @@ __all__ = [
     "SmartThingsNotFoundError",
     "SmartThingsRateLimitError",
     "SmartThingsSinkError",
+    "Snapshot",
+    "StateStore",
     "Status",
+    "StatusFile",
+    "StreamRecorder",
+    "StreamReplayer",
     "Subscription",
+    "Topology",
 ]
@@ -3,11 +3,21 @@
 import logging
 
 API_BASE = "api.smartthings.com"
+API_URL = f"https://{API_BASE}"
 # Version required to use SSE
 API_VERSION = 20250122
+API_ACCEPT = f"application/vnd.smartthings+json;v={API_VERSION}"
 
 LOGGER = logging.getLogger(__package__)
 
+# Connection pool of sessions created by the client. All requests go to the
+# same host, so the per-host limit is what caps concurrent requests; the idle
+# keepalive outlives the gaps between polls and DNS answers are reused.
+CONNECTION_LIMIT = 100
+CONNECTION_LIMIT_PER_HOST = 30
+KEEPALIVE_TIMEOUT = 60
+DNS_CACHE_TTL = 300
+
 # Maximum number of seconds we will wait for a single SSE line before assuming
 # the connection is dead and triggering a reconnect. SmartThings emits a
 # keepalive comment well within this interval; values larger than the keepalive
@@ -0,0 +1,203 @@
+"""Durable log of the events received by the SmartThings client."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+import orjson
+
+from .const import LOGGER
+from .files import write_atomic
+from .snapshot import Snapshot
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .smartthings import SmartThings
+
+
+def _numbers(directory: Path, prefix: str, suffix: str) -> list[int]:
+    """Return the sorted numbers of the numbered files in a directory."""
+    numbers = []
+    for path in directory.glob(f"{prefix}.*{suffix}"):
+        number = path.name.removeprefix(f"{prefix}.").removesuffix(suffix)
+        if number.isdigit():
+            numbers.append(int(number))
+    return sorted(numbers)
+
+
+def _read_events(path: Path) -> list[tuple[str, str]]:
+    """Read the events of a log segment, up to the first incomplete one."""
+    events = []
+    with path.open("rb") as file:
+        for line in file:
+            try:
+                event_type, data = orjson.loads(line)  # pylint: disable=no-member
+            except orjson.JSONDecodeError:  # pylint: disable=no-member
+                LOGGER.warning("Ignoring incomplete events at the end of %s", path)
+                break
+            events.append((event_type, data))
+    return events
+
+
+class EventLog:
+    """Append-only log of the events of a client, compacted into snapshots.
+
+    Every event is appended to the current log segment as a JSON line before
+    it is dispatched. Segments are synced to disk in batches, at most
+    `sync_interval` seconds or `sync_events` events apart. Every
+    `compact_interval` seconds the snapshot is saved and the segments it
+    covers are removed, so a restart loads the last snapshot and replays
+    only the events received since, instead of fetching every status.
+
+    Start the log before subscribing, so no event is missed.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        sync_interval: float = 1.0,
+        sync_events: int = 1000,
+        compact_interval: float = 3600.0,
+    ) -> None:
+        """Initialize the event log."""
+        self.directory = Path(directory)
+        self.sync_interval = sync_interval
+        self.sync_events = sync_events
+        self.compact_interval = compact_interval
+        self.snapshot = Snapshot()
+        self._client: SmartThings | None = None
+        self._remove_listener: Callable[[], None] | None = None
+        self._segment = 0
+        self._file: BinaryIO | None = None
+        self._pending = 0
+        self._sync_needed = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def _snapshot_path(self, number: int) -> Path:
+        """Return the path of a snapshot."""
+        return self.directory / f"snapshot.{number}.json"
+
+    def _segment_path(self, number: int) -> Path:
+        """Return the path of a log segment."""
+        return self.directory / f"events.{number}.log"
+
+    async def start(self, client: SmartThings) -> Snapshot:
+        """Restore the snapshot and start logging the events of a client.
+
+        The last snapshot is loaded and the events logged after it are
+        replayed through the client, so its listeners see them again.
+        """
+        await asyncio.to_thread(self.directory.mkdir, parents=True, exist_ok=True)
+        snapshots = _numbers(self.directory, "snapshot", ".json")
+        segments = _numbers(self.directory, "events", ".log")
+        base = 0
+        snapshot = None
+        for number in reversed(snapshots):
+            snapshot = await asyncio.to_thread(
+                Snapshot.load, self._snapshot_path(number)
+            )
+            if snapshot is not None:
+                base = number
+                break
+        self.snapshot = snapshot or Snapshot()
+        self._remove_listener = self.snapshot.listen(client)
+        for number in segments:
+            if number < base:
+                continue
+            for event_type, data in await asyncio.to_thread(
+                _read_events, self._segment_path(number)
+            ):
+                client._dispatch_event(  # pylint: disable=protected-access  # noqa: SLF001
+                    event_type, data
+                )
+        self._segment = max([base, *segments]) + 1
+        self._file = await asyncio.to_thread(
+            self._segment_path(self._segment).open, "ab"
+        )
+        self._client = client
+        client.raw_event_callback = self.record
+        self._task = asyncio.create_task(self._run())
+        return self.snapshot
+
+    def record(self, event_type: str, data: str) -> None:
+        """Append an event to the log."""
+        assert self._file is not None  # noqa: S101
+        self._file.write(
+            orjson.dumps([event_type, data]) + b"\n"  # pylint: disable=no-member
+        )
+        self._pending += 1
+        if self._pending >= self.sync_events:
+            self._sync_needed.set()
+
+    async def _run(self) -> None:
+        """Sync the log and compact it periodically."""
+        loop = asyncio.get_running_loop()
+        next_compaction = loop.time() + self.compact_interval
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._sync_needed.wait(), self.sync_interval)
+            self._sync_needed.clear()
+            try:
+                await self.sync()
+                if loop.time() >= next_compaction:
+                    next_compaction = loop.time() + self.compact_interval
+                    await self.compact()
+            except OSError:
+                LOGGER.exception("Error occurred while writing the event log")
+
+    async def sync(self) -> None:
+        """Write the logged events to disk."""
+        if self._file is None or not self._pending:
+            return
+        self._pending = 0
+        self._file.flush()
+        await asyncio.to_thread(os.fsync, self._file.fileno())
+
+    async def compact(self) -> None:
+        """Save the snapshot and remove the log segments it covers.
+
+        Devices still being fetched for logged lifecycle events are waited
+        for, so the segments are only removed once the snapshot holds them.
+        """
+        if self._file is None:
+            return
+        segment = self._segment + 1
+        file = await asyncio.to_thread(self._segment_path(segment).open, "ab")
+        # Events from here on go to the new segment, and the snapshot holds
+        # all events of the previous ones.
+        previous, self._file, self._segment = self._file, file, segment
+        self._pending = 0
+        await self.snapshot.topology.wait_for_fetches()
+        data = self.snapshot.dumps()
+        await asyncio.to_thread(previous.close)
+        await asyncio.to_thread(write_atomic, self._snapshot_path(segment), data)
+        for number in _numbers(self.directory, "snapshot", ".json"):
+            if number < segment:
+                self._snapshot_path(number).unlink(missing_ok=True)
+        for number in _numbers(self.directory, "events", ".log"):
+            if number < segment:
+                self._segment_path(number).unlink(missing_ok=True)
+
+    async def close(self) -> None:
+        """Stop logging, writing the logged events to disk."""
+        if self._client is not None:
+            self._client.raw_event_callback = None
+            self._client = None
+        if self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._file is not None:
+            await self.sync()
+            await asyncio.to_thread(self._file.close)
+            self._file = None
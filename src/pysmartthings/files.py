@@ -0,0 +1,28 @@
+"""Durable writes of the files kept by the SmartThings client."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def write_atomic(path: str | os.PathLike[str], data: bytes | bytearray) -> None:
+    """Write a file durably, replacing it atomically.
+
+    The data is written to a temporary file next to it and synced to disk
+    before it replaces the file, so a crash leaves either version whole.
+    """
+    path = Path(path)
+    temporary = path.with_name(f"{path.name}.tmp")
+    with temporary.open("wb") as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    temporary.replace(path)
+    if os.name == "posix":
+        # Sync the directory too, so the rename itself survives a crash.
+        directory = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
@@ -0,0 +1,134 @@
+"""Index of the health of SmartThings devices."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .models import HealthStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Set as AbstractSet
+
+    from .models import DeviceHealth, DeviceHealthEvent
+    from .smartthings import SmartThings
+    from .topology import Topology
+
+
+@dataclass
+class HealthIndex:
+    """Health of devices, kept up to date by device health events.
+
+    Lookups of the status of a device and of the devices with a status are
+    constant time. The returned sets are live views and must not be changed.
+
+    With a topology, a hub that goes offline or unhealthy takes all devices
+    below it along. When the hub comes back online they return to their
+    previous status, unless they sent an event of their own in the meantime.
+    """
+
+    topology: Topology | None = None
+    _statuses: dict[str, HealthStatus] = field(default_factory=dict)
+    _devices: dict[HealthStatus, set[str]] = field(
+        default_factory=lambda: {status: set() for status in HealthStatus}
+    )
+    _propagated: dict[str, dict[str, HealthStatus | None]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """Return the number of devices in the index."""
+        return len(self._statuses)
+
+    def __contains__(self, device_id: object) -> bool:
+        """Return if the health of a device is known."""
+        return device_id in self._statuses
+
+    def update(self, device_id: str, status: HealthStatus) -> None:
+        """Set the health status of a device."""
+        previous = self._statuses.get(device_id)
+        if previous is status:
+            return
+        if previous is not None:
+            self._devices[previous].discard(device_id)
+        self._statuses[device_id] = status
+        self._devices[status].add(device_id)
+
+    def update_many(self, device_ids: Iterable[str], status: HealthStatus) -> None:
+        """Set the health status of devices."""
+        for device_id in device_ids:
+            self.update(device_id, status)
+
+    def remove(self, device_id: str) -> None:
+        """Remove a device from the index."""
+        if (status := self._statuses.pop(device_id, None)) is not None:
+            self._devices[status].discard(device_id)
+        self._propagated.pop(device_id, None)
+        self._forget_propagation(device_id)
+
+    def _forget_propagation(self, device_id: str) -> None:
+        """Keep a device with a status of its own when its hub comes back."""
+        for changed in self._propagated.values():
+            changed.pop(device_id, None)
+
+    def _propagate(self, hub_id: str, status: HealthStatus) -> None:
+        """Set the status of the devices below a hub, or restore them."""
+        assert self.topology is not None  # noqa: S101
+        if status is HealthStatus.ONLINE:
+            for device_id, previous in self._propagated.pop(hub_id, {}).items():
+                if previous is None:
+                    self.remove(device_id)
+                else:
+                    self.update(device_id, previous)
+            return
+        changed = self._propagated.setdefault(hub_id, {})
+        for device_id in self.topology.descendants(hub_id):
+            if device_id not in changed:
+                changed[device_id] = self._statuses.get(device_id)
+            self.update(device_id, status)
+
+    def handle_health(self, health: DeviceHealth) -> None:
+        """Update the index with the result of a health request."""
+        self._forget_propagation(health.device_id)
+        self.update(health.device_id, health.state)
+
+    def handle_event(self, event: DeviceHealthEvent) -> None:
+        """Update the index with a device health event."""
+        self._forget_propagation(event.device_id)
+        self.update(event.device_id, event.status)
+        if self.topology is not None and event.device_id in self.topology.hubs:
+            self._propagate(event.device_id, event.status)
+
+    def status(self, device_id: str) -> HealthStatus | None:
+        """Return the health status of a device, None if unknown."""
+        return self._statuses.get(device_id)
+
+    def devices(self, status: HealthStatus) -> AbstractSet[str]:
+        """Return the ids of the devices with a health status."""
+        return self._devices[status]
+
+    @property
+    def online(self) -> AbstractSet[str]:
+        """Return the ids of the online devices."""
+        return self._devices[HealthStatus.ONLINE]
+
+    @property
+    def offline(self) -> AbstractSet[str]:
+        """Return the ids of the offline devices."""
+        return self._devices[HealthStatus.OFFLINE]
+
+    @property
+    def unhealthy(self) -> AbstractSet[str]:
+        """Return the ids of the unhealthy devices."""
+        return self._devices[HealthStatus.UNHEALTHY]
+
+    def listen(self, client: SmartThings) -> Callable[[], None]:
+        """Keep the index up to date with the health events of a client."""
+        return client.add_unspecified_device_availability_event_listener(
+            self.handle_event
+        )
+
+    async def load(
+        self, client: SmartThings, device_ids: Iterable[str], concurrency: int = 10
+    ) -> None:
+        """Fetch the health of devices, at most `concurrency` at a time."""
+        async for health in client.get_devices_health(device_ids, concurrency):
+            self.handle_health(health)
@@ -0,0 +1,123 @@
+"""Instrumentation of requests and events of the SmartThings client."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import re
+import time
+from typing import TYPE_CHECKING
+
+from aiohttp import TraceConfig
+
+if TYPE_CHECKING:
+    from types import SimpleNamespace
+
+    from aiohttp import (
+        ClientSession,
+        TraceConnectionCreateEndParams,
+        TraceConnectionCreateStartParams,
+        TraceConnectionReuseconnParams,
+    )
+
+_ID = re.compile(r"[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}")
+
+
+@dataclass
+class RequestMetrics:
+    """Metrics of a single request.
+
+    Timings are in seconds. The connect time is 0 for a reused connection and
+    None when unknown, which is the case for sessions not created by the
+    client. Requests that time out or fail to connect are reported with a
+    status and time to first byte of None.
+    """
+
+    method: str
+    endpoint: str
+    status: int | None
+    bytes_received: int
+    connect: float | None
+    time_to_first_byte: float | None
+    total: float
+
+
+@dataclass
+class EventStreamStats:
+    """Counters of the event stream.
+
+    Decode and callback times are the total seconds spent decoding events and
+    running their listeners. The lag is how many seconds after its
+    `eventTime` the last event was processed.
+    """
+
+    started: float = field(default_factory=time.monotonic)
+    events: int = 0
+    bytes_received: int = 0
+    events_by_type: dict[str, int] = field(default_factory=dict)
+    decode_time: float = 0.0
+    callback_time: float = 0.0
+    lag: float | None = None
+    max_lag: float = 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        """Return the average number of events per second."""
+        return self.events / max(time.monotonic() - self.started, 1e-9)
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Return the average number of bytes received per second."""
+        return self.bytes_received / max(time.monotonic() - self.started, 1e-9)
+
+    def count(self, event_type: str) -> None:
+        """Count a received event."""
+        self.events += 1
+        self.events_by_type[event_type] = self.events_by_type.get(event_type, 0) + 1
+
+    def record(self, event_time: int, decode_time: float, callback_time: float) -> None:
+        """Record the processing of an event."""
+        self.decode_time += decode_time
+        self.callback_time += callback_time
+        self.lag = time.time() - event_time / 1000
+        self.max_lag = max(self.max_lag, self.lag)
+
+
+def endpoint_template(path: str) -> str:
+    """Return the endpoint of a path with identifiers replaced by `{id}`."""
+    return _ID.sub("{id}", path)
+
+
+async def _on_connection_create_start(
+    _: ClientSession,
+    trace_config_ctx: SimpleNamespace,
+    __: TraceConnectionCreateStartParams,
+) -> None:
+    if (timings := trace_config_ctx.trace_request_ctx) is not None:
+        timings["connect_start"] = time.perf_counter()
+
+
+async def _on_connection_create_end(
+    _: ClientSession,
+    trace_config_ctx: SimpleNamespace,
+    __: TraceConnectionCreateEndParams,
+) -> None:
+    if (timings := trace_config_ctx.trace_request_ctx) is not None:
+        timings["connect"] = time.perf_counter() - timings["connect_start"]
+
+
+async def _on_connection_reuseconn(
+    _: ClientSession,
+    trace_config_ctx: SimpleNamespace,
+    __: TraceConnectionReuseconnParams,
+) -> None:
+    if (timings := trace_config_ctx.trace_request_ctx) is not None:
+        timings["connect"] = 0.0
+
+
+def create_trace_config() -> TraceConfig:
+    """Return a trace config that records connection timings of a request."""
+    trace_config = TraceConfig()
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+    return trace_config
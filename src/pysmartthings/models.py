@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime  # noqa: TC003
+from datetime import datetime
 from enum import StrEnum
-from typing import Any
+import sys
+from typing import Any, cast
 
 from mashumaro import field_options
+from mashumaro.config import BaseConfig
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 
 from .attribute import Attribute
@@ -16,6 +18,44 @@ from .const import LOGGER
 
 ALREADY_LOGGED_CAPABILITIES: set[str | Capability] = set()
 
+_CAPABILITIES: dict[str, Capability] = {
+    capability.value: capability for capability in Capability
+}
+_ATTRIBUTES: dict[str, Attribute] = {
+    attribute.value: attribute for attribute in Attribute
+}
+
+
+def _deserialize_capability(value: str) -> Capability | str:
+    """Return the canonical instance of a capability name."""
+    if (capability := _CAPABILITIES.get(value)) is not None:
+        return capability
+    return sys.intern(value)
+
+
+def _deserialize_status_capability(value: str) -> Capability | str:
+    """Return the canonical instance of a capability name in a device status.
+
+    Make sure we let the user know about unknown capabilities, but only the
+    first time we see them.
+    """
+    if (capability := _CAPABILITIES.get(value)) is not None:
+        return capability
+    if value not in ALREADY_LOGGED_CAPABILITIES:
+        ALREADY_LOGGED_CAPABILITIES.add(value)
+        LOGGER.warning(
+            "Unknown capability %s. Please raise an issue at https://github.com/pySmartThings/pysmartthings.",
+            value,
+        )
+    return sys.intern(value)
+
+
+def _deserialize_attribute(value: str) -> Attribute | str:
+    """Return the canonical instance of an attribute name."""
+    if (attribute := _ATTRIBUTES.get(value)) is not None:
+        return attribute
+    return sys.intern(value)
+
 
 @dataclass
 class InstalledApp(DataClassORJSONMixin):
@@ -235,11 +275,14 @@ class Category(StrEnum):
     WINE_CELLAR = "WineCellar"
 
 
+_CATEGORIES: frozenset[str] = frozenset(Category)
+
+
 @dataclass
 class Component(DataClassORJSONMixin):
     """Component model."""
 
-    id: str
+    id: str = field(metadata=field_options(deserialize=sys.intern))
     capabilities: list[Capability | str]
     manufacturer_category: Category | str
     label: str | None = None
@@ -250,7 +293,7 @@ class Component(DataClassORJSONMixin):
         """Pre deserialize hook."""
         d["capabilities"] = [c["id"] for c in d["capabilities"]]
         for cat in d["categories"]:
-            if (category := cat["name"]) not in Category:
+            if (category := cat["name"]) not in _CATEGORIES:
                 LOGGER.error(
                     "Unknown category `%s`. Please raise an issue at https://github.com/pySmartThings/pysmartthings.",
                     category,
@@ -378,11 +421,10 @@ class Hub(DataClassORJSONMixin):
     @classmethod
     def __pre_deserialize__(cls, d: dict[str, Any]) -> dict[str, Any]:
         """Pre deserialize hook."""
-        return {
-            **d,
-            "hardwareType": d["hubData"]["hardwareType"],
-            "macAddress": d["hubData"].get("macAddress"),
-        }
+        hub_data = d["hubData"]
+        d["hardwareType"] = hub_data["hardwareType"]
+        d["macAddress"] = hub_data.get("macAddress")
+        return d
 
 
 @dataclass
@@ -430,7 +472,9 @@ class Device(DataClassORJSONMixin):
     @classmethod
     def __pre_deserialize__(cls, d: dict[str, Any]) -> dict[str, Any]:
         """Pre deserialize hook."""
-        d["components"] = {component["id"]: component for component in d["components"]}
+        d["components"] = {
+            sys.intern(component["id"]): component for component in d["components"]
+        }
         return d
 
 
@@ -445,37 +489,80 @@ class Scene(DataClassORJSONMixin):
     color: str | None = field(metadata=field_options(alias="sceneColor"), default=None)
 
 
+class _LazyTimestamp:
+    """Timestamp descriptor that parses the raw ISO string on first access.
+
+    Only a small fraction of status timestamps are ever read, so decoding keeps
+    the string as received and `datetime.fromisoformat` handles the fixed
+    SmartThings format (including the trailing `Z`) when it is needed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the descriptor."""
+        self._attribute = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Set the name of the attribute holding the value."""
+        self._attribute = f"_{name}"
+
+    def __get__(self, obj: object | None, owner: type | None = None) -> datetime | None:
+        """Return the timestamp, parsing it if needed."""
+        if obj is None:
+            return None
+        value = obj.__dict__[self._attribute]
+        if isinstance(value, str):
+            value = obj.__dict__[self._attribute] = datetime.fromisoformat(value)
+        return cast("datetime | None", value)
+
+    def __set__(self, obj: object, value: datetime | str | None) -> None:
+        """Store the timestamp as is."""
+        obj.__dict__[self._attribute] = value
+
+
 @dataclass
 class Status(DataClassORJSONMixin):
     """Status model."""
 
     value: str | int | float | dict[str, Any] | list[Any] | None
-    unit: str | None = None
+    unit: str | None = field(
+        metadata=field_options(deserialize=sys.intern), default=None
+    )
     data: dict[str, Any] | None = None
-    timestamp: datetime | None = None
+    timestamp: datetime | None = _LazyTimestamp()  # type: ignore[assignment]
+
+    class Config(BaseConfig):  # pylint: disable=too-few-public-methods
+        """Keep timestamps as raw strings until they are read."""
+
+        serialization_strategy = {datetime: {"deserialize": str}}  # noqa: RUF012
+
+
+def _deserialize_components(
+    components: dict[str, dict[str, dict[str, Any]]],
+) -> dict[str, ComponentStatus]:
+    """Deserialize component statuses with canonical identifiers.
+
+    Component ids, capability names and attribute names repeat across every
+    device, so they are mapped onto the enum members or interned strings.
+    """
+    return {
+        sys.intern(component_id): {
+            _deserialize_status_capability(capability): {
+                _deserialize_attribute(attribute): Status.from_dict(status)
+                for attribute, status in attributes.items()
+            }
+            for capability, attributes in capabilities.items()
+        }
+        for component_id, capabilities in components.items()
+    }
 
 
 @dataclass
 class DeviceStatus(DataClassORJSONMixin):
     """Device status model."""
 
-    components: dict[str, ComponentStatus]
-
-    @classmethod
-    def __post_deserialize__(cls, obj: DeviceStatus) -> DeviceStatus:
-        """Make sure we let the user know about unknown capabilities."""
-        for component in obj.components.values():
-            for capability in component:
-                if (
-                    capability not in Capability
-                    and capability not in ALREADY_LOGGED_CAPABILITIES
-                ):
-                    ALREADY_LOGGED_CAPABILITIES.add(capability)
-                    LOGGER.warning(
-                        "Unknown capability %s. Please raise an issue at https://github.com/pySmartThings/pysmartthings.",
-                        capability,
-                    )
-        return obj
+    components: dict[str, ComponentStatus] = field(
+        metadata=field_options(deserialize=_deserialize_components)
+    )
 
 
 @dataclass
@@ -502,10 +589,9 @@ class DeviceResponse(DataClassORJSONMixin):
     @classmethod
     def __pre_deserialize__(cls, d: dict[str, Any]) -> dict[str, Any]:
         """Pre deserialize hook."""
-        return {
-            **d,
-            "next_link": d.get("_links", {}).get("next", {}).get("href"),
-        }
+        next_page = (d.get("_links") or {}).get("next")
+        d["next_link"] = next_page.get("href") if next_page else None
+        return d
 
 
 @dataclass
@@ -550,9 +636,15 @@ class DeviceEvent(DataClassORJSONMixin):
     location_id: str = field(metadata=field_options(alias="locationId"))
     owner_id: str = field(metadata=field_options(alias="ownerId"))
     device_id: str = field(metadata=field_options(alias="deviceId"))
-    component_id: str = field(metadata=field_options(alias="componentId"))
-    capability: Capability | str
-    attribute: Attribute | str
+    component_id: str = field(
+        metadata=field_options(alias="componentId", deserialize=sys.intern)
+    )
+    capability: Capability | str = field(
+        metadata=field_options(deserialize=_deserialize_capability)
+    )
+    attribute: Attribute | str = field(
+        metadata=field_options(deserialize=_deserialize_attribute)
+    )
     value: str | int | float | dict[str, Any] | list[Any] | None
     data: dict[str, Any] | None = None
 
@@ -574,6 +666,19 @@ class Lifecycle(StrEnum):
     ROOM_MOVE = "ROOM_MOVE"
 
 
+@dataclass
+class RoomMove(DataClassORJSONMixin):
+    """Room move model."""
+
+    room_id_from: str | None = field(metadata=field_options(alias="roomIdFrom"))
+    room_id_to: str | None = field(metadata=field_options(alias="roomIdTo"))
+
+    @classmethod
+    def __pre_deserialize__(cls, d: dict[str, Any]) -> dict[str, Any]:
+        """Pre deserialize hook."""
+        return {key: value or None for key, value in d.items()}
+
+
 @dataclass
 class DeviceLifecycleEvent(DataClassORJSONMixin):
     """Device lifecycle event model."""
@@ -581,6 +686,9 @@ class DeviceLifecycleEvent(DataClassORJSONMixin):
     lifecycle: Lifecycle
     device_id: str = field(metadata=field_options(alias="deviceId"))
     location_id: str = field(metadata=field_options(alias="locationId"))
+    room_move: RoomMove | None = field(
+        metadata=field_options(alias="roomMove"), default=None
+    )
 
 
 @dataclass
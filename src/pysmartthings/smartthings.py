@@ -4,14 +4,32 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass, field
+from functools import lru_cache
+import time
 from typing import TYPE_CHECKING, Any, Self, cast
 
-from aiohttp import ClientConnectionError, ClientError, ClientSession, ClientTimeout
-from aiohttp.hdrs import METH_DELETE, METH_GET, METH_POST, METH_PUT
+from aiohttp import (
+    ClientConnectionError,
+    ClientError,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+)
+from aiohttp.hdrs import CONTENT_TYPE, METH_DELETE, METH_GET, METH_POST, METH_PUT
 import orjson
 from yarl import URL
 
-from .const import API_BASE, API_VERSION, LOGGER, SSE_READ_TIMEOUT
+from .const import (
+    API_ACCEPT,
+    API_URL,
+    API_VERSION,
+    CONNECTION_LIMIT,
+    CONNECTION_LIMIT_PER_HOST,
+    DNS_CACHE_TTL,
+    KEEPALIVE_TIMEOUT,
+    LOGGER,
+    SSE_READ_TIMEOUT,
+)
 from .exceptions import (
     SmartThingsAuthenticationFailedError,
     SmartThingsCommandError,
@@ -19,6 +37,12 @@ from .exceptions import (
     SmartThingsForbiddenError,
     SmartThingsSinkError,
 )
+from .metrics import (
+    EventStreamStats,
+    RequestMetrics,
+    create_trace_config,
+    endpoint_template,
+)
 from .models import (
     BaseLocation,
     Device,
@@ -27,10 +51,12 @@ from .models import (
     DeviceHealth,
     DeviceHealthEvent,
     DeviceHealthEventRoot,
+    DeviceLifecycleEvent,
     DeviceLifecycleEventRoot,
     DeviceResponse,
     DeviceStatus,
     ErrorResponse,
+    Event,
     EventType,
     InstalledApp,
     Lifecycle,
@@ -43,15 +69,29 @@ from .models import (
     Status,
     Subscription,
 )
+from .stream import EventStreamParser
+from .topology import Topology
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 
     from .attribute import Attribute
     from .capability import Capability
     from .command import Command
 
 
+@lru_cache(maxsize=256)
+def _command_prefix(component: str, capability: str, command: str) -> bytes:
+    """Return the serialized request body of a command without its closing."""
+    return orjson.dumps(  # pylint: disable=no-member
+        {
+            "commands": [
+                {"component": component, "capability": capability, "command": command}
+            ]
+        }
+    )[: -len(b"}]}")]
+
+
 @dataclass
 class SmartThings:
     """Define a class for interacting with the SmartThings Cloud API."""
@@ -63,6 +103,20 @@ class SmartThings:
     refresh_token_function: Callable[[], Awaitable[str]] | None = None
     new_subscription_id_callback: Callable[[str | None], None] | None = None
     max_connections_reached_callback: Callable[[], None] | None = None
+    base_url: str | URL = API_URL
+    sse_session: ClientSession | None = None
+    _close_sse_session: bool = False
+    connection_limit: int = CONNECTION_LIMIT
+    connection_limit_per_host: int = CONNECTION_LIMIT_PER_HOST
+    keepalive_timeout: float = KEEPALIVE_TIMEOUT
+    dns_cache_ttl: int = DNS_CACHE_TTL
+    request_callback: Callable[[RequestMetrics], None] | None = None
+    slow_listener_threshold: float | None = None
+    raw_event_callback: Callable[[str, str], None] | None = None
+    raw_stream_callback: Callable[[bytes], None] | None = None
+    __base_url: URL = field(init=False)
+    __request_headers: dict[str, str] = field(default_factory=dict)
+    __request_headers_token: str | None = None
     __capability_event_listeners: dict[
         tuple[str, str, Capability | str],
         list[Callable[[DeviceEvent], None]],
@@ -73,13 +127,25 @@ class SmartThings:
     __device_event_listeners: dict[str, list[Callable[[DeviceEvent], None]]] = field(
         default_factory=dict
     )
+    __unspecified_device_availability_event_listeners: list[
+        Callable[[DeviceHealthEvent], None]
+    ] = field(default_factory=list)
     __device_availability_event_listeners: dict[
         str, list[Callable[[DeviceHealthEvent], None]]
     ] = field(default_factory=dict)
+    __unspecified_device_lifecycle_event_listeners: list[
+        Callable[[DeviceLifecycleEvent], None]
+    ] = field(default_factory=list)
     __device_lifecycle_event_listeners: dict[Lifecycle, list[Callable[[str], None]]] = (
         field(default_factory=dict)
     )
     __retry_count: int = 0
+    __event_stream_stats: EventStreamStats = field(default_factory=EventStreamStats)
+    __warm_up_task: asyncio.Task[None] | None = None
+
+    def __post_init__(self) -> None:
+        """Prepare the parts of requests that don't change between calls."""
+        self.__base_url = URL(self.base_url)
 
     async def refresh_token(self) -> None:
         """Refresh token with provided function."""
@@ -96,30 +162,67 @@ class SmartThings:
             "Authorization": f"Bearer {self._token}",
         }
 
+    def _get_request_headers(self) -> dict[str, str]:
+        """Get headers for API requests, only rebuilt when the token changes."""
+        if not self.__request_headers or self.__request_headers_token != self._token:
+            self.__request_headers = {
+                "Accept": API_ACCEPT,
+                **self._get_headers(),
+            }
+            self.__request_headers_token = self._token
+        return self.__request_headers
+
+    def _create_session(self) -> ClientSession:
+        """Create a session with a connection pool tuned for the API."""
+        return ClientSession(
+            connector=TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+            ),
+            trace_configs=[create_trace_config()] if self.request_callback else None,
+        )
+
+    def _get_session(self) -> ClientSession:
+        """Get the session for API requests, creating one if needed."""
+        if self.session is None:
+            self.session = self._create_session()
+            self._close_session = True
+        return self.session
+
+    def _get_sse_session(self) -> ClientSession:
+        """Get the session for the event stream.
+
+        When the client manages its own sessions, the stream gets a dedicated
+        connector so it never competes with API calls for a pooled connection.
+        """
+        if self.sse_session is None:
+            if self.session is not None and not self._close_session:
+                return self.session
+            self.sse_session = ClientSession(
+                connector=TCPConnector(ttl_dns_cache=self.dns_cache_ttl)
+            )
+            self._close_sse_session = True
+        return self.sse_session
+
     async def _request(
         self,
         method: str,
         uri: str,
         *,
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | None = None,
         params: dict[str, Any] | None = None,
-    ) -> str:
+    ) -> bytes:
         """Handle a request to SmartThings."""
-        url = URL.build(
-            scheme="https",
-            host=API_BASE,
-            port=443,
-        ).joinpath(uri)
-
         await self.refresh_token()
 
-        headers = {
-            "Accept": f"application/vnd.smartthings+json;v={API_VERSION}",
-            **self._get_headers(),
-        }
-
         return await self.__internal_request(
-            method, url, headers, data=data, params=params
+            method,
+            self.__base_url.joinpath(uri),
+            self._get_request_headers(),
+            data=data,
+            params=params,
         )
 
     async def __internal_request(
@@ -127,30 +230,54 @@ class SmartThings:
         method: str,
         url: URL,
         headers: dict[str, str],
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | None = None,
         params: dict[str, Any] | None = None,
-    ) -> str:
-        if self.session is None:
-            self.session = ClientSession()
-            self._close_session = True
+    ) -> bytes:
+        session = self._get_session()
+
+        body: bytes | None = None
+        if data is not None:
+            body = (
+                data if isinstance(data, bytes) else orjson.dumps(data)  # pylint: disable=no-member
+            )
+            headers = {**headers, CONTENT_TYPE: "application/json"}
+
+        # Only measured when someone listens, the trace hooks skip requests
+        # without a context.
+        timings: dict[str, float] | None = None
+        trace: dict[str, Any] = {}
+        if self.request_callback is not None:
+            timings = {"start": time.perf_counter()}
+            trace["trace_request_ctx"] = timings
 
         try:
             async with asyncio.timeout(self.request_timeout):
-                response = await self.session.request(
+                response = await session.request(
                     method,
                     url,
                     headers=headers,
-                    json=data,
+                    data=body,
                     params=params,
+                    **trace,
                 )
         except TimeoutError as exception:
+            if timings is not None:
+                self.__report_request(method, url, None, b"", timings)
             msg = "Timeout occurred while connecting to SmartThings"
             raise SmartThingsConnectionError(msg) from exception
         except ClientConnectionError as exception:
+            if timings is not None:
+                self.__report_request(method, url, None, b"", timings)
             msg = "Error occurred while connecting to SmartThings"
             raise SmartThingsConnectionError(msg) from exception
 
-        text = await response.text()
+        if timings is not None:
+            timings["first_byte"] = time.perf_counter()
+
+        body = await response.read()
+
+        if timings is not None:
+            self.__report_request(method, url, response.status, body, timings)
 
         if response.status == 401:
             msg = "Authentication failed with SmartThings"
@@ -161,38 +288,68 @@ class SmartThings:
             raise SmartThingsForbiddenError(msg)
 
         if response.status in {409, 422}:
-            raise SmartThingsCommandError(ErrorResponse.from_json(text))
+            raise SmartThingsCommandError(ErrorResponse.from_json(body))
+
+        return body
 
-        return text
+    def __report_request(
+        self,
+        method: str,
+        url: URL,
+        status: int | None,
+        body: bytes,
+        timings: dict[str, float],
+    ) -> None:
+        """Pass the metrics of a request to the request callback."""
+        assert self.request_callback is not None  # noqa: S101
+        end = time.perf_counter()
+        first_byte = timings.get("first_byte")
+        metrics = RequestMetrics(
+            method=method,
+            endpoint=endpoint_template(
+                url.path.removeprefix(self.__base_url.path).lstrip("/")
+            ),
+            status=status,
+            bytes_received=len(body),
+            connect=timings.get("connect"),
+            time_to_first_byte=(
+                None if first_byte is None else first_byte - timings["start"]
+            ),
+            total=end - timings["start"],
+        )
+        try:
+            self.request_callback(metrics)
+        except Exception:  # pylint: disable=broad-except  # noqa: BLE001
+            LOGGER.exception("Error occurred in the request callback")
 
-    async def _get(self, uri: str, params: dict[str, Any] | None = None) -> str:
+    async def _get(self, uri: str, params: dict[str, Any] | None = None) -> bytes:
         """Handle a GET request to SmartThings."""
         return await self._request(METH_GET, uri, params=params)
 
     async def _post(
         self,
         uri: str,
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | None = None,
         params: dict[str, Any] | None = None,
-    ) -> str:
+    ) -> bytes:
         """Handle a POST request to SmartThings."""
         return await self._request(METH_POST, uri, data=data, params=params)
 
     async def _put(
         self,
         uri: str,
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | None = None,
         params: dict[str, Any] | None = None,
-    ) -> str:
+    ) -> bytes:
         """Handle a PUT request to SmartThings."""
         return await self._request(METH_PUT, uri, data=data, params=params)
 
     async def _delete(
         self,
         uri: str,
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | None = None,
         params: dict[str, Any] | None = None,
-    ) -> str:
+    ) -> bytes:
         """Handle a DELETE request to SmartThings."""
         return await self._request(METH_DELETE, uri, data=data, params=params)
 
@@ -224,7 +381,7 @@ class SmartThings:
         device_ids: list[str] | None = None,
         max_results: int | None = None,
         page: int | None = None,
-    ) -> str:
+    ) -> bytes:
         """Retrieve SmartThings devices."""
         params: dict[str, Any] = {}
         if capabilities:
@@ -286,7 +443,7 @@ class SmartThings:
             next_page_url = resp.get("_links", {}).get("next", {}).get("href")
         return response
 
-    async def _get_device(self, device_id: str) -> str:
+    async def _get_device(self, device_id: str) -> bytes:
         """Retrieve a device with the specified ID."""
         return await self._get(f"v1/devices/{device_id}")
 
@@ -307,16 +464,83 @@ class SmartThings:
         resp = await self._get("v1/scenes", params=params)
         return SceneResponse.from_json(resp).items
 
+    async def load_topology(self) -> Topology:
+        """Load all locations, rooms, devices and scenes concurrently."""
+
+        async def _get_locations() -> list[tuple[Location, list[Room]]]:
+            return await asyncio.gather(
+                *(
+                    asyncio.gather(
+                        self.get_location(location.location_id),
+                        self.get_rooms(location.location_id),
+                    )
+                    for location in await self.get_locations()
+                )
+            )
+
+        locations, devices, scenes = await asyncio.gather(
+            _get_locations(), self.get_devices(), self.get_scenes()
+        )
+        topology = Topology()
+        for location, rooms in locations:
+            topology.add_location(location)
+            for room in rooms:
+                topology.add_room(room)
+        for device in devices:
+            topology.add_device(device)
+        for scene in scenes:
+            topology.add_scene(scene)
+        return topology
+
     async def get_device_health(self, device_id: str) -> DeviceHealth:
         """Retrieve device health with the specified ID."""
         resp = await self._get(f"v1/devices/{device_id}/health")
         return DeviceHealth.from_json(resp)
 
+    async def get_devices_health(
+        self, device_ids: Iterable[str], concurrency: int = 10
+    ) -> AsyncIterator[DeviceHealth]:
+        """Retrieve the health of devices, yielded as the requests complete.
+
+        At most `concurrency` requests are in flight at the same time. Devices
+        whose health can't be retrieved are logged and skipped, but a failed
+        authentication ends the iteration.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _get_device_health(device_id: str) -> DeviceHealth | None:
+            async with semaphore:
+                try:
+                    return await self.get_device_health(device_id)
+                except SmartThingsAuthenticationFailedError:
+                    raise
+                except Exception:  # pylint: disable=broad-except  # noqa: BLE001
+                    LOGGER.exception(
+                        "Error occurred while fetching the health of device %s",
+                        device_id,
+                    )
+                    return None
+
+        tasks = [
+            asyncio.create_task(_get_device_health(device_id))
+            for device_id in device_ids
+        ]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                if (device_health := await completed) is not None:
+                    yield device_health
+        finally:
+            for task in tasks:
+                if task.done() and not task.cancelled():
+                    # Retrieve the errors of the requests that weren't awaited.
+                    task.exception()
+                task.cancel()
+
     async def execute_scene(self, scene_id: str) -> None:
         """Execute the scene with the specified ID."""
         await self._post(f"v1/scenes/{scene_id}/execute")
 
-    async def _get_device_status(self, device_id: str) -> str:
+    async def _get_device_status(self, device_id: str) -> bytes:
         """Retrieve the status of a device."""
         return await self._get(f"v1/devices/{device_id}/status")
 
@@ -334,20 +558,17 @@ class SmartThings:
 
     async def get_capability(self, capability: Capability | str) -> str:
         """Retrieve the capability schema."""
-        return await self._get(f"v1/capabilities/{capability}/1")
+        resp = await self._get(f"v1/capabilities/{capability}/1")
+        return resp.decode()
 
     async def delete_smart_app(
         self, personal_access_token: str, smart_app_id: str
     ) -> None:
         """Delete a SmartApp."""
-        url = URL.build(
-            scheme="https",
-            host=API_BASE,
-            port=443,
-        ).joinpath(f"v1/apps/{smart_app_id}")
+        url = self.__base_url.joinpath(f"v1/apps/{smart_app_id}")
 
         headers = {
-            "Accept": f"application/vnd.smartthings+json;v={API_VERSION}",
+            "Accept": API_ACCEPT,
             "Authorization": f"Bearer {personal_access_token}",
         }
 
@@ -357,14 +578,10 @@ class SmartThings:
         self, personal_access_token: str, installed_app_id: str
     ) -> InstalledApp:
         """Retrieve an installed SmartApp."""
-        url = URL.build(
-            scheme="https",
-            host=API_BASE,
-            port=443,
-        ).joinpath(f"v1/installedapps/{installed_app_id}")
+        url = self.__base_url.joinpath(f"v1/installedapps/{installed_app_id}")
 
         headers = {
-            "Accept": f"application/vnd.smartthings+json;v={API_VERSION}",
+            "Accept": API_ACCEPT,
             "Authorization": f"Bearer {personal_access_token}",
         }
 
@@ -375,14 +592,10 @@ class SmartThings:
         self, personal_access_token: str, installed_app_id: str
     ) -> None:
         """Delete an installed SmartApp."""
-        url = URL.build(
-            scheme="https",
-            host=API_BASE,
-            port=443,
-        ).joinpath(f"v1/installedapps/{installed_app_id}")
+        url = self.__base_url.joinpath(f"v1/installedapps/{installed_app_id}")
 
         headers = {
-            "Accept": f"application/vnd.smartthings+json;v={API_VERSION}",
+            "Accept": API_ACCEPT,
             "Authorization": f"Bearer {personal_access_token}",
         }
 
@@ -397,20 +610,14 @@ class SmartThings:
         argument: int | str | list[Any] | dict[str, Any] | None = None,
     ) -> None:
         """Execute a command on a device."""
-        command_payload: dict[str, Any] = {
-            "component": component,
-            "capability": capability,
-            "command": command,
-        }
+        body = _command_prefix(component, capability, command)
         if argument is not None:
-            command_payload["arguments"] = (
+            body += b',"arguments":' + orjson.dumps(  # pylint: disable=no-member
                 argument if isinstance(argument, list) else [argument]
             )
-        LOGGER.debug("Executing command for device %s: %s", device_id, command_payload)
-        response = await self._post(
-            f"v1/devices/{device_id}/commands",
-            data={"commands": [command_payload]},
-        )
+        body += b"}]}"
+        LOGGER.debug("Executing command for device %s: %s", device_id, body)
+        response = await self._post(f"v1/devices/{device_id}/commands", data=body)
         LOGGER.debug("Command response: %s", response)
 
     def add_unspecified_device_event_listener(
@@ -420,6 +627,15 @@ class SmartThings:
         self.__unspecified_device_event_listeners.append(callback)
         return lambda: self.__unspecified_device_event_listeners.remove(callback)
 
+    def add_unspecified_device_lifecycle_event_listener(
+        self, callback: Callable[[DeviceLifecycleEvent], None]
+    ) -> Callable[[], None]:
+        """Add a listener for all device lifecycle events."""
+        self.__unspecified_device_lifecycle_event_listeners.append(callback)
+        return lambda: self.__unspecified_device_lifecycle_event_listeners.remove(
+            callback
+        )
+
     def add_device_lifecycle_event_listener(
         self, lifecycle_event: Lifecycle, callback: Callable[[str], None]
     ) -> Callable[[], None]:
@@ -465,6 +681,15 @@ class SmartThings:
             callback
         )
 
+    def add_unspecified_device_availability_event_listener(
+        self, callback: Callable[[DeviceHealthEvent], None]
+    ) -> Callable[[], None]:
+        """Add a listener for availability events of all devices."""
+        self.__unspecified_device_availability_event_listeners.append(callback)
+        return lambda: self.__unspecified_device_availability_event_listeners.remove(
+            callback
+        )
+
     async def create_subscription(
         self, location_id: str, installed_app_id: str
     ) -> Subscription:
@@ -494,62 +719,111 @@ class SmartThings:
             raise SmartThingsSinkError(msg) from err
         return Subscription.from_json(resp)
 
-    def _dispatch_event(self, event_type: str, data: str) -> bool:  # noqa: PLR0912
+    @property
+    def event_stream_stats(self) -> EventStreamStats:
+        """Return the counters of the event stream since subscribing."""
+        return self.__event_stream_stats
+
+    def _dispatch_event(self, event_type: str, data: str) -> bool:
         """Dispatch a single SSE event. Return False to stop the connection."""
         LOGGER.debug("Received event: %s", data)
-        if event_type == EventType.DEVICE_EVENT:
-            device_event = DeviceEventRoot.from_json(data).device_event
+        if self.raw_event_callback is not None:
             try:
-                for callback in self.__unspecified_device_event_listeners:
-                    callback(device_event)
-                if device_event.device_id in self.__device_event_listeners:
-                    for callback in self.__device_event_listeners[
-                        device_event.device_id
-                    ]:
-                        callback(device_event)
-                key = (
-                    device_event.device_id,
-                    device_event.component_id,
-                    device_event.capability,
-                )
-                if key in self.__capability_event_listeners:
-                    for callback in self.__capability_event_listeners[key]:
-                        callback(device_event)
+                self.raw_event_callback(event_type, data)
             except Exception:  # pylint: disable=broad-except  # noqa: BLE001
-                LOGGER.exception(
-                    "Error occurred while processing device event: %s",
-                    device_event,
-                )
+                LOGGER.exception("Error occurred in the raw event callback")
+        self.__event_stream_stats.count(event_type)
+        start = time.perf_counter()
+        root: Event
+        if event_type == EventType.DEVICE_EVENT:
+            root = DeviceEventRoot.from_json(data)
         elif event_type == EventType.DEVICE_LIFECYCLE_EVENT:
-            device_lifecycle_event = DeviceLifecycleEventRoot.from_json(
-                data
-            ).device_lifecycle_event
-            if (
-                device_lifecycle_event.lifecycle
-                in self.__device_lifecycle_event_listeners
-            ):
-                for dle_callback in self.__device_lifecycle_event_listeners[
-                    device_lifecycle_event.lifecycle
-                ]:
-                    dle_callback(device_lifecycle_event.device_id)
+            root = DeviceLifecycleEventRoot.from_json(data)
         elif event_type == EventType.DEVICE_HEALTH_EVENT:
-            device_health_event = DeviceHealthEventRoot.from_json(
-                data
-            ).device_health_event
-            if (
-                device_health_event.device_id
-                in self.__device_availability_event_listeners
-            ):
-                for dhe_callback in self.__device_availability_event_listeners[
-                    device_health_event.device_id
-                ]:
-                    dhe_callback(device_health_event)
-        elif event_type == EventType.CONTROL_EVENT:
-            if data in {"goodbye", "goobye"}:
+            root = DeviceHealthEventRoot.from_json(data)
+        else:
+            if event_type == EventType.CONTROL_EVENT and data in {
+                "goodbye",
+                "goobye",
+            }:
                 LOGGER.debug("Received goodbye event, closing connection")
                 return False
+            return True
+        decoded = time.perf_counter()
+        if isinstance(root, DeviceEventRoot):
+            self.__dispatch_device_event(root.device_event)
+        elif isinstance(root, DeviceLifecycleEventRoot):
+            self.__dispatch_device_lifecycle_event(root.device_lifecycle_event)
+        elif isinstance(root, DeviceHealthEventRoot):
+            self.__dispatch_device_health_event(root.device_health_event)
+        self.__event_stream_stats.record(
+            root.event_time, decoded - start, time.perf_counter() - decoded
+        )
         return True
 
+    def __call_listener(self, callback: Callable[[Any], None], event: object) -> None:
+        """Call a listener, isolating its failures from the other listeners."""
+        threshold = self.slow_listener_threshold
+        start = time.perf_counter() if threshold is not None else 0.0
+        try:
+            callback(event)
+        except Exception:  # pylint: disable=broad-except  # noqa: BLE001
+            LOGGER.exception(
+                "Error occurred in listener %s while processing event: %s",
+                callback,
+                event,
+            )
+        if (
+            threshold is not None
+            and (elapsed := time.perf_counter() - start) > threshold
+        ):
+            LOGGER.warning(
+                "Listener %s took %.3f seconds to process event: %s",
+                callback,
+                elapsed,
+                event,
+            )
+
+    def __dispatch_device_event(self, device_event: DeviceEvent) -> None:
+        """Pass a device event to its listeners."""
+        for callback in self.__unspecified_device_event_listeners:
+            self.__call_listener(callback, device_event)
+        if device_event.device_id in self.__device_event_listeners:
+            for callback in self.__device_event_listeners[device_event.device_id]:
+                self.__call_listener(callback, device_event)
+        key = (
+            device_event.device_id,
+            device_event.component_id,
+            device_event.capability,
+        )
+        if key in self.__capability_event_listeners:
+            for callback in self.__capability_event_listeners[key]:
+                self.__call_listener(callback, device_event)
+
+    def __dispatch_device_lifecycle_event(
+        self, device_lifecycle_event: DeviceLifecycleEvent
+    ) -> None:
+        """Pass a device lifecycle event to its listeners."""
+        for event_callback in self.__unspecified_device_lifecycle_event_listeners:
+            self.__call_listener(event_callback, device_lifecycle_event)
+        if device_lifecycle_event.lifecycle in self.__device_lifecycle_event_listeners:
+            for callback in self.__device_lifecycle_event_listeners[
+                device_lifecycle_event.lifecycle
+            ]:
+                self.__call_listener(callback, device_lifecycle_event.device_id)
+
+    def __dispatch_device_health_event(
+        self, device_health_event: DeviceHealthEvent
+    ) -> None:
+        """Pass a device health event to its listeners."""
+        for callback in self.__unspecified_device_availability_event_listeners:
+            self.__call_listener(callback, device_health_event)
+        if device_health_event.device_id in self.__device_availability_event_listeners:
+            for callback in self.__device_availability_event_listeners[
+                device_health_event.device_id
+            ]:
+                self.__call_listener(callback, device_health_event)
+
     async def _internal_subscribe(self, session: ClientSession, url: str) -> None:
         """Subscribe to events via Server-Sent Events.
 
@@ -576,8 +850,7 @@ class SmartThings:
         async with session.get(url, headers=headers, timeout=timeout) as resp:
             resp.raise_for_status()
             self.__on_open()
-            event_type = ""
-            data_lines: list[str] = []
+            parser = EventStreamParser()
             while True:
                 # Per-line read timeout. SmartThings sends keepalive comments
                 # periodically; if nothing is received for SSE_READ_TIMEOUT
@@ -595,34 +868,24 @@ class SmartThings:
                 if not raw:
                     LOGGER.debug("SSE connection closed by server")
                     return
+                self.__event_stream_stats.bytes_received += len(raw)
+                if self.raw_stream_callback is not None:
+                    try:
+                        self.raw_stream_callback(raw)
+                    except Exception:  # pylint: disable=broad-except  # noqa: BLE001
+                        LOGGER.exception("Error occurred in the raw stream callback")
                 line = raw.decode("utf-8").rstrip("\r\n")
-                if line == "":
-                    # Dispatch accumulated event
-                    if data_lines and not self._dispatch_event(
-                        event_type or "message", "\n".join(data_lines)
-                    ):
-                        return
-                    event_type = ""
-                    data_lines = []
-                    continue
-                if line.startswith(":"):
-                    # Comment / keepalive
-                    continue
-                field_name, sep, value = line.partition(":")
-                if sep and value.startswith(" "):
-                    value = value[1:]
-                if field_name == "event":
-                    event_type = value
-                elif field_name == "data":
-                    data_lines.append(value)
-                # id / retry fields ignored
+                if (event := parser.feed(line)) is not None and not (
+                    self._dispatch_event(*event)
+                ):
+                    return
 
     def __on_open(self) -> None:
         """Handle the opening of the connection."""
         LOGGER.debug("Connection opened")
         self.__retry_count = 0
 
-    async def subscribe(  # noqa: PLR0912, PLR0915  # pylint: disable=too-many-statements,too-many-branches
+    async def subscribe(  # noqa: PLR0915  # pylint: disable=too-many-statements,too-many-branches
         self,
         location_id: str,
         installed_app_id: str,
@@ -630,11 +893,9 @@ class SmartThings:
     ) -> None:
         """Create a subscription."""
         self.__retry_count = 0
+        self.__event_stream_stats = EventStreamStats()
         using_initial = initial_subscription is not None
-        if self.session is None:
-            self.session = ClientSession()
-            self._close_session = True
-        session = self.session
+        session = self._get_sse_session()
         while True:
             try:
                 if using_initial:
@@ -692,10 +953,56 @@ class SmartThings:
         if self.new_subscription_id_callback:
             self.new_subscription_id_callback(None)
 
+    async def warm_up(
+        self, connections: int = 1, keep_alive_interval: float | None = None
+    ) -> None:
+        """Open connections to the API ahead of the first request.
+
+        The connections are opened concurrently and kept in the pool for
+        later requests. With a keep alive interval, shorter than the
+        keepalive timeout of the pool, they are refreshed in the background
+        until the client is closed.
+        """
+        if self.__warm_up_task is not None:
+            self.__warm_up_task.cancel()
+            self.__warm_up_task = None
+        await self.__open_connections(connections)
+        if keep_alive_interval is not None:
+            self.__warm_up_task = asyncio.create_task(
+                self.__keep_connections_warm(connections, keep_alive_interval)
+            )
+
+    async def __keep_connections_warm(self, connections: int, interval: float) -> None:
+        """Periodically refresh pooled connections."""
+        while True:
+            await asyncio.sleep(interval)
+            await self.__open_connections(connections)
+
+    async def __open_connections(self, connections: int) -> None:
+        """Open connections with concurrent lightweight requests."""
+        session = self._get_session()
+
+        async def _open_connection() -> None:
+            try:
+                async with (
+                    asyncio.timeout(self.request_timeout),
+                    session.head(self.__base_url) as response,
+                ):
+                    await response.read()
+            except (TimeoutError, ClientError) as err:
+                LOGGER.debug("Error while warming up a connection: %s", err)
+
+        await asyncio.gather(*(_open_connection() for _ in range(connections)))
+
     async def close(self) -> None:
         """Close open client session."""
+        if self.__warm_up_task is not None:
+            self.__warm_up_task.cancel()
+            self.__warm_up_task = None
         if self.session and self._close_session:
             await self.session.close()
+        if self.sse_session and self._close_sse_session:
+            await self.sse_session.close()
 
     async def __aenter__(self) -> Self:
         """Async enter.
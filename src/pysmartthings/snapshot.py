@@ -0,0 +1,168 @@
+"""On-disk snapshot of the devices and statuses of an account."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields, is_dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from .const import API_VERSION, LOGGER
+from .files import write_atomic
+from .models import Component, Device, DeviceStatus, Hub, Matter
+from .state import StateStore
+from .topology import Topology
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    import os
+
+    from .smartthings import SmartThings
+
+
+def _component_document(d: dict[str, Any]) -> None:
+    """Restore the capabilities and categories of a component."""
+    d["capabilities"] = [{"id": capability} for capability in d["capabilities"]]
+    d["categories"] = [
+        {"name": d.pop("manufacturer_category"), "categoryType": "manufacturer"}
+    ]
+    if (user_category := d.pop("user_category")) is not None:
+        d["categories"].append({"name": user_category, "categoryType": "user"})
+
+
+def _device_document(d: dict[str, Any]) -> None:
+    """Restore the list of components of a device."""
+    d["components"] = list(d["components"].values())
+
+
+def _hub_document(d: dict[str, Any]) -> None:
+    """Restore the hub data of a hub."""
+    d["hubData"] = {
+        "hardwareType": d.pop("hardwareType"),
+        "macAddress": d.pop("macAddress"),
+    }
+
+
+def _matter_document(d: dict[str, Any]) -> None:
+    """Restore the version of a Matter device."""
+    d["version"] = {
+        "hardwareLabel": d.pop("hardwareVersion"),
+        "softwareLabel": d.pop("softwareVersion"),
+    }
+
+
+# Undo the pre deserialize hooks of the models.
+_DOCUMENT_HOOKS: dict[type, Callable[[dict[str, Any]], None]] = {
+    Component: _component_document,
+    Device: _device_document,
+    Hub: _hub_document,
+    Matter: _matter_document,
+}
+
+
+def _document(obj: Any) -> Any:
+    """Return the API document a model was decoded from."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        d = {
+            item.metadata.get("alias") or item.name: _document(getattr(obj, item.name))
+            for item in fields(obj)
+        }
+        if (hook := _DOCUMENT_HOOKS.get(type(obj))) is not None:
+            hook(d)
+        return d
+    if isinstance(obj, dict):
+        return {key: _document(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_document(value) for value in obj]
+    return obj
+
+
+@dataclass
+class Snapshot:
+    """Devices and their statuses, saved to disk to start without the API.
+
+    Devices and statuses are stored in the shape returned by the API and
+    decoded with the same models, so a snapshot of another API version is
+    ignored. Start from a loaded snapshot, listen to the client and refresh
+    in the background to catch up with changes made in the meantime.
+
+    Saving and loading do blocking file I/O, run them in an executor.
+    """
+
+    topology: Topology = field(default_factory=Topology)
+    state: StateStore = field(default_factory=StateStore)
+
+    def dumps(self) -> bytes:
+        """Return the snapshot as JSON."""
+        return orjson.dumps(  # pylint: disable=no-member
+            {
+                "version": API_VERSION,
+                "devices": [
+                    _document(device) for device in self.topology.devices.values()
+                ],
+                "statuses": {
+                    device_id: _document(components)
+                    for device_id, components in self.state.statuses.items()
+                },
+            },
+            option=orjson.OPT_NON_STR_KEYS,  # pylint: disable=no-member
+        )
+
+    @classmethod
+    def loads(cls, data: bytes | str) -> Snapshot | None:
+        """Return a snapshot from JSON, None if of another API version."""
+        snapshot = orjson.loads(data)  # pylint: disable=no-member
+        if snapshot.get("version") != API_VERSION:
+            return None
+        topology = Topology()
+        for device in snapshot["devices"]:
+            topology.add_device(Device.from_dict(device))
+        state = StateStore()
+        for device_id, components in snapshot["statuses"].items():
+            state.set_device_status(
+                device_id, DeviceStatus.from_dict({"components": components}).components
+            )
+        return cls(topology, state)
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the snapshot to a file durably, replacing it atomically."""
+        write_atomic(path, self.dumps())
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> Snapshot | None:
+        """Read a snapshot from a file, None if missing, invalid or outdated."""
+        try:
+            data = Path(path).read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            return cls.loads(data)
+        except Exception:  # pylint: disable=broad-except  # noqa: BLE001
+            LOGGER.warning("Ignoring invalid snapshot %s", path, exc_info=True)
+            return None
+
+    def listen(self, client: SmartThings) -> Callable[[], None]:
+        """Keep the devices and statuses up to date with the events of a client."""
+        remove_topology_listener = self.topology.listen(client)
+        remove_state_listener = self.state.listen(client)
+
+        def _remove() -> None:
+            remove_topology_listener()
+            remove_state_listener()
+
+        return _remove
+
+    async def refresh(self, client: SmartThings, concurrency: int = 10) -> None:
+        """Replace the devices and statuses with their current version.
+
+        Devices removed since the snapshot was taken are dropped, and the
+        statuses are fetched at most `concurrency` at a time.
+        """
+        devices = {device.device_id: device for device in await client.get_devices()}
+        for device_id in set(self.topology.devices) - devices.keys():
+            self.topology.remove_device(device_id)
+            self.state.remove_device(device_id)
+        for device in devices.values():
+            self.topology.add_device(device)
+        await self.state.load(client, devices, concurrency)
@@ -0,0 +1,129 @@
+"""Store of the current status of SmartThings devices."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .const import LOGGER
+from .exceptions import SmartThingsAuthenticationFailedError
+from .models import Status
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from .attribute import Attribute
+    from .capability import Capability
+    from .models import ComponentStatus, DeviceEvent
+    from .smartthings import SmartThings
+
+
+@dataclass
+class StateStore:
+    """Status of devices, kept up to date by device events.
+
+    Statuses are stored per device in the shape returned by
+    `get_device_status`. Events update the value and data of an attribute in
+    place; the timestamp is kept from the last status request.
+    """
+
+    statuses: dict[str, dict[str, ComponentStatus]] = field(default_factory=dict)
+
+    def set_device_status(
+        self, device_id: str, components: dict[str, ComponentStatus]
+    ) -> None:
+        """Set the status of all components of a device."""
+        self.statuses[device_id] = components
+
+    def remove_device(self, device_id: str) -> None:
+        """Remove the status of a device."""
+        self.statuses.pop(device_id, None)
+
+    def get_status(
+        self,
+        device_id: str,
+        capability: Capability | str,
+        attribute: Attribute | str,
+        component: str = "main",
+    ) -> Status | None:
+        """Return the status of an attribute, None if unknown."""
+        if (components := self.statuses.get(device_id)) is None:
+            return None
+        if (capabilities := components.get(component)) is None:
+            return None
+        if (attributes := capabilities.get(capability)) is None:
+            return None
+        return attributes.get(attribute)
+
+    def handle_event(self, event: DeviceEvent) -> None:
+        """Update the store with a device event."""
+        capabilities = self.statuses.setdefault(event.device_id, {}).setdefault(
+            event.component_id, {}
+        )
+        attributes = capabilities.setdefault(event.capability, {})
+        if (status := attributes.get(event.attribute)) is None:
+            attributes[event.attribute] = Status(value=event.value, data=event.data)
+        else:
+            status.value = event.value
+            status.data = event.data
+
+    def listen(self, client: SmartThings) -> Callable[[], None]:
+        """Keep the store up to date with the device events of a client."""
+        return client.add_unspecified_device_event_listener(self.handle_event)
+
+    async def load(
+        self, client: SmartThings, device_ids: Iterable[str], concurrency: int = 10
+    ) -> None:
+        """Fetch the status of devices, at most `concurrency` at a time.
+
+        Devices whose status can't be fetched are logged and skipped, but a
+        failed authentication cancels the remaining requests and is raised.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _load(device_id: str) -> None:
+            async with semaphore:
+                try:
+                    status = await client.get_device_status(device_id)
+                except SmartThingsAuthenticationFailedError:
+                    raise
+                except Exception:  # pylint: disable=broad-except  # noqa: BLE001
+                    LOGGER.exception(
+                        "Error occurred while fetching the status of device %s",
+                        device_id,
+                    )
+                    return
+                self.set_device_status(device_id, status)
+
+        tasks = [asyncio.create_task(_load(device_id)) for device_id in device_ids]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+@dataclass(frozen=True)
+class Condition:
+    """Condition on the current value of an attribute.
+
+    The value is compared for equality, unless a predicate is given.
+    """
+
+    capability: Capability | str
+    attribute: Attribute | str
+    value: Any = None
+    predicate: Callable[[Any], bool] | None = None
+    component: str = "main"
+
+    def matches(self, state: StateStore, device_id: str) -> bool:
+        """Return if the current value of a device meets the condition."""
+        status = state.get_status(
+            device_id, self.capability, self.attribute, self.component
+        )
+        if status is None:
+            return False
+        if self.predicate is not None:
+            return self.predicate(status.value)
+        return bool(status.value == self.value)
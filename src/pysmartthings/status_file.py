@@ -0,0 +1,159 @@
+"""Memory-mapped file of device statuses shared between processes."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+import mmap
+import os
+from pathlib import Path
+import struct
+from typing import TYPE_CHECKING, Self
+
+from .const import API_VERSION
+from .files import write_atomic
+from .models import Status
+
+if TYPE_CHECKING:
+    from .attribute import Attribute
+    from .capability import Capability
+    from .state import StateStore
+
+_MAGIC = b"PSTS"
+_FORMAT_VERSION = 1
+# Magic, format version, API version and number of statuses.
+_HEADER = struct.Struct("<4sIII")
+# Offset and length of the key, offset and length of the status.
+_RECORD = struct.Struct("<QIQI")
+
+
+def _key(
+    device_id: str,
+    capability: Capability | str,
+    attribute: Attribute | str,
+    component: str,
+) -> bytes:
+    """Return the index key of an attribute."""
+    return f"{device_id}\0{component}\0{capability}\0{attribute}".encode()
+
+
+class _Keys:
+    """Sequence of the sorted keys of a status file, read from the file."""
+
+    def __init__(self, buffer: mmap.mmap, count: int) -> None:
+        """Initialize the keys."""
+        self._buffer = buffer
+        self._count = count
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return self._count
+
+    def __getitem__(self, index: int) -> bytes:
+        """Return the key of a record."""
+        offset, length, _, _ = _RECORD.unpack_from(
+            self._buffer, _HEADER.size + index * _RECORD.size
+        )
+        return self._buffer[offset : offset + length]
+
+
+class StatusFile:
+    """Read-only view of the statuses of a state store in a file.
+
+    The file starts with an index of the statuses sorted by device,
+    component, capability and attribute, followed by the statuses as JSON.
+    Readers memory-map it and only decode the statuses they look up, so all
+    processes on a host share the same pages whatever their number.
+
+    Writing replaces the file atomically. Open readers keep the previous
+    version until they `reload`.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Open a status file."""
+        self.path = Path(path)
+        self._open()
+
+    def _open(self) -> None:
+        """Map the file and check its header."""
+        with self.path.open("rb") as file:
+            self._inode = os.fstat(file.fileno()).st_ino
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, format_version, api_version, count = _HEADER.unpack_from(self._buffer)
+        if (magic, format_version, api_version) != (
+            _MAGIC,
+            _FORMAT_VERSION,
+            API_VERSION,
+        ):
+            self._buffer.close()
+            msg = f"{self.path} is not a status file of API version {API_VERSION}"
+            raise ValueError(msg)
+        self._keys = _Keys(self._buffer, count)
+
+    @staticmethod
+    def write(state: StateStore, path: str | os.PathLike[str]) -> None:
+        """Write the statuses of a state store to a file."""
+        documents = sorted(
+            (_key(device_id, capability, attribute, component), status.to_jsonb())
+            for device_id, components in state.statuses.items()
+            for component, capabilities in components.items()
+            for capability, attributes in capabilities.items()
+            for attribute, status in attributes.items()
+        )
+        index = bytearray(
+            _HEADER.pack(_MAGIC, _FORMAT_VERSION, API_VERSION, len(documents))
+        )
+        keys = bytearray()
+        values = bytearray()
+        keys_offset = _HEADER.size + len(documents) * _RECORD.size
+        for key, _ in documents:
+            keys += key
+        values_offset = keys_offset + len(keys)
+        key_offset = keys_offset
+        for key, value in documents:
+            index += _RECORD.pack(
+                key_offset, len(key), values_offset + len(values), len(value)
+            )
+            key_offset += len(key)
+            values += value
+        write_atomic(path, index + keys + values)
+
+    def reload(self) -> bool:
+        """Map the file again if it was replaced, return if it was."""
+        if self.path.stat().st_ino == self._inode:
+            return False
+        self._buffer.close()
+        self._open()
+        return True
+
+    def __len__(self) -> int:
+        """Return the number of statuses in the file."""
+        return len(self._keys)
+
+    def get_status(
+        self,
+        device_id: str,
+        capability: Capability | str,
+        attribute: Attribute | str,
+        component: str = "main",
+    ) -> Status | None:
+        """Return the status of an attribute, None if unknown."""
+        key = _key(device_id, capability, attribute, component)
+        index = bisect_left(self._keys, key)
+        if index == len(self._keys) or self._keys[index] != key:
+            return None
+        _, _, offset, length = _RECORD.unpack_from(
+            self._buffer, _HEADER.size + index * _RECORD.size
+        )
+        return Status.from_json(self._buffer[offset : offset + length])
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._buffer.close()
+
+    def __enter__(self) -> Self:
+        """Enter the context."""
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        """Close the file."""
+        self.close()
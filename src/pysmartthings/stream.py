@@ -0,0 +1,133 @@
+"""Parsing, recording and replaying of the SmartThings event stream."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, BinaryIO
+
+import orjson
+
+if TYPE_CHECKING:
+    import os
+
+    from .smartthings import SmartThings
+
+
+class EventStreamParser:  # pylint: disable=too-few-public-methods
+    """Parser of the lines of a Server-Sent Events stream."""
+
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        self.event_type = ""
+        self.data_lines: list[str] = []
+
+    def feed(self, line: str) -> tuple[str, str] | None:
+        """Parse a line, return the type and data of the event it completes."""
+        if line == "":
+            event = None
+            if self.data_lines:
+                event = (self.event_type or "message", "\n".join(self.data_lines))
+            self.event_type = ""
+            self.data_lines = []
+            return event
+        if line.startswith(":"):
+            # Comment / keepalive
+            return None
+        field_name, sep, value = line.partition(":")
+        if sep and value.startswith(" "):
+            value = value[1:]
+        if field_name == "event":
+            self.event_type = value
+        elif field_name == "data":
+            self.data_lines.append(value)
+        # id / retry fields ignored
+        return None
+
+
+class StreamRecorder:
+    """Recorder of the event stream of a client.
+
+    Every line received on the stream, keepalives included, is written as a
+    JSON line with the time it was received, to be replayed later with a
+    `StreamReplayer`. Lines are written from the event loop, so this is
+    meant for diagnostics rather than continuous use.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Initialize the recorder."""
+        self.path = Path(path)
+        self._client: SmartThings | None = None
+        self._file: BinaryIO | None = None
+
+    def start(self, client: SmartThings) -> None:
+        """Start recording the event stream of a client."""
+        self._file = self.path.open("ab")  # pylint: disable=consider-using-with
+        self._client = client
+        client.raw_stream_callback = self.record
+
+    def record(self, raw: bytes) -> None:
+        """Write a line of the stream."""
+        assert self._file is not None  # noqa: S101
+        self._file.write(
+            orjson.dumps([time.time(), raw.decode("utf-8")])  # pylint: disable=no-member
+            + b"\n"
+        )
+
+    def close(self) -> None:
+        """Stop recording."""
+        if self._client is not None:
+            self._client.raw_stream_callback = None
+            self._client = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _read_lines(path: Path) -> list[tuple[float, str]]:
+    """Read the lines of a recording with the time they were received."""
+    lines = []
+    with path.open("rb") as file:
+        for raw in file:
+            received, line = orjson.loads(raw)  # pylint: disable=no-member
+            lines.append((received, line))
+    return lines
+
+
+class StreamReplayer:  # pylint: disable=too-few-public-methods
+    """Replayer of a recorded event stream.
+
+    The events are dispatched to the client as if received on its stream,
+    at the recorded pace divided by `speed`, or as fast as possible without
+    yielding to the event loop when `speed` is None. Like the stream, the
+    replay stops at an event that closes the connection.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], speed: float | None = 1.0) -> None:
+        """Initialize the replayer."""
+        self.path = Path(path)
+        self.speed = speed
+
+    async def replay(self, client: SmartThings) -> int:
+        """Replay the recording to a client, return the number of events."""
+        lines = await asyncio.to_thread(_read_lines, self.path)
+        if not lines:
+            return 0
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        first = lines[0][0]
+        parser = EventStreamParser()
+        events = 0
+        for received, line in lines:
+            if self.speed is not None:
+                delay = started + (received - first) / self.speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            if (event := parser.feed(line.rstrip("\r\n"))) is not None:
+                events += 1
+                if not client._dispatch_event(  # pylint: disable=protected-access  # noqa: SLF001
+                    *event
+                ):
+                    break
+        return events
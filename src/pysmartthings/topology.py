@@ -0,0 +1,311 @@
+"""Indexed graph of the locations, rooms and devices of an account."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
+
+from .const import LOGGER
+from .models import DeviceType, Lifecycle
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Set as AbstractSet
+
+    from .capability import Capability
+    from .models import Category, Device, DeviceLifecycleEvent, Location, Room, Scene
+    from .smartthings import SmartThings
+    from .state import Condition, StateStore
+
+_EMPTY: frozenset[str] = frozenset()
+
+
+def _add(index: dict[Any, set[str]], key: Any, item_id: str) -> None:
+    """Add an id to an index."""
+    if key not in index:
+        index[key] = set()
+    index[key].add(item_id)
+
+
+def _discard(index: dict[Any, set[str]], key: Any, item_id: str) -> None:
+    """Remove an id from an index, dropping keys without ids."""
+    if (item_ids := index.get(key)) is not None:
+        item_ids.discard(item_id)
+        if not item_ids:
+            del index[key]
+
+
+def _parents(device: Device) -> set[str]:
+    """Return the ids of the parent device and hub of a device."""
+    parents = set()
+    if device.parent_device_id:
+        parents.add(device.parent_device_id)
+    if device.matter is not None and device.matter.hub_id:
+        parents.add(device.matter.hub_id)
+    parents.discard(device.device_id)
+    return parents
+
+
+@dataclass
+class Topology:
+    """Locations, rooms, devices and scenes of an account.
+
+    Devices are indexed by location, room, type, capability, category and
+    parent device or hub, so every lookup returns the matching device ids
+    without scanning the devices. The returned sets are live views and must
+    not be changed.
+
+    Once listening to a client, device lifecycle events keep the devices up
+    to date: created and updated devices are fetched, deleted devices are
+    removed and room moves are applied directly.
+    """
+
+    locations: dict[str, Location] = field(default_factory=dict)
+    rooms: dict[str, Room] = field(default_factory=dict)
+    devices: dict[str, Device] = field(default_factory=dict)
+    scenes: dict[str, Scene] = field(default_factory=dict)
+    _location_rooms: dict[str, set[str]] = field(default_factory=dict)
+    _location_devices: dict[str, set[str]] = field(default_factory=dict)
+    _room_devices: dict[str, set[str]] = field(default_factory=dict)
+    _capability_devices: dict[Capability | str, set[str]] = field(default_factory=dict)
+    _category_devices: dict[Category | str, set[str]] = field(default_factory=dict)
+    _manufacturer_category_devices: dict[Category | str, set[str]] = field(
+        default_factory=dict
+    )
+    _user_category_devices: dict[Category | str, set[str]] = field(default_factory=dict)
+    _device_type_devices: dict[DeviceType, set[str]] = field(default_factory=dict)
+    _children: dict[str, set[str]] = field(default_factory=dict)
+    _hubs: set[str] = field(default_factory=set)
+    _fetches: dict[str, asyncio.Task[None]] = field(default_factory=dict)
+
+    def add_location(self, location: Location) -> None:
+        """Add or replace a location."""
+        self.locations[location.location_id] = location
+
+    def add_room(self, room: Room) -> None:
+        """Add or replace a room."""
+        if (previous := self.rooms.get(room.room_id)) is not None:
+            _discard(self._location_rooms, previous.location_id, room.room_id)
+        self.rooms[room.room_id] = room
+        _add(self._location_rooms, room.location_id, room.room_id)
+
+    def add_scene(self, scene: Scene) -> None:
+        """Add or replace a scene."""
+        self.scenes[scene.scene_id] = scene
+
+    def _index_keys(self, device: Device) -> Iterator[tuple[dict[Any, set[str]], Any]]:
+        """Return the indexes of a device with its key in each of them."""
+        yield self._location_devices, device.location_id
+        if device.room_id is not None:
+            yield self._room_devices, device.room_id
+        yield self._device_type_devices, device.type
+        for component in device.components.values():
+            for capability in component.capabilities:
+                yield self._capability_devices, capability
+            yield self._category_devices, component.manufacturer_category
+            yield (
+                self._manufacturer_category_devices,
+                component.manufacturer_category,
+            )
+            if component.user_category is not None:
+                yield self._category_devices, component.user_category
+                yield self._user_category_devices, component.user_category
+        for parent_id in _parents(device):
+            yield self._children, parent_id
+
+    def add_device(self, device: Device) -> None:
+        """Add or replace a device."""
+        device_id = device.device_id
+        self.remove_device(device_id)
+        self.devices[device_id] = device
+        for index, key in self._index_keys(device):
+            _add(index, key, device_id)
+        if device.hub is not None or device.type == DeviceType.HUB:
+            self._hubs.add(device_id)
+
+    def remove_device(self, device_id: str) -> Device | None:
+        """Remove a device and return it, if it was known."""
+        if (device := self.devices.pop(device_id, None)) is None:
+            return None
+        for index, key in self._index_keys(device):
+            _discard(index, key, device_id)
+        self._hubs.discard(device_id)
+        return device
+
+    def move_device(self, device_id: str, room_id: str | None) -> None:
+        """Move a device to another room."""
+        if (device := self.devices.get(device_id)) is None:
+            return
+        if device.room_id is not None:
+            _discard(self._room_devices, device.room_id, device_id)
+        self.devices[device_id] = replace(device, room_id=room_id)
+        if room_id is not None:
+            _add(self._room_devices, room_id, device_id)
+
+    def listen(self, client: SmartThings) -> Callable[[], None]:
+        """Keep the devices up to date with the lifecycle events of a client."""
+
+        def _handle_event(event: DeviceLifecycleEvent) -> None:
+            self.handle_lifecycle_event(client, event)
+
+        return client.add_unspecified_device_lifecycle_event_listener(_handle_event)
+
+    def handle_lifecycle_event(
+        self, client: SmartThings, event: DeviceLifecycleEvent
+    ) -> None:
+        """Apply a device lifecycle event, fetching the device if needed."""
+        device_id = event.device_id
+        if event.lifecycle in {Lifecycle.CREATE, Lifecycle.UPDATE}:
+            self._fetch_device(client, device_id)
+        elif event.lifecycle == Lifecycle.DELETE:
+            if (task := self._fetches.pop(device_id, None)) is not None:
+                task.cancel()
+            self.remove_device(device_id)
+        elif event.lifecycle == Lifecycle.ROOM_MOVE:
+            if device_id in self._fetches:
+                # The pending fetch returns the device in its new room.
+                return
+            if event.room_move is None:
+                self._fetch_device(client, device_id)
+            else:
+                self.move_device(device_id, event.room_move.room_id_to)
+
+    def _fetch_device(self, client: SmartThings, device_id: str) -> None:
+        """Fetch a device in the background, replacing any pending fetch."""
+        if (previous := self._fetches.get(device_id)) is not None:
+            previous.cancel()
+        task = asyncio.create_task(self._add_fetched_device(client, device_id))
+        self._fetches[device_id] = task
+
+        def _done(_: asyncio.Task[None]) -> None:
+            if self._fetches.get(device_id) is task:
+                del self._fetches[device_id]
+
+        task.add_done_callback(_done)
+
+    async def _add_fetched_device(self, client: SmartThings, device_id: str) -> None:
+        """Fetch a device and add it."""
+        try:
+            device = await client.get_device(device_id)
+        except Exception:  # pylint: disable=broad-except  # noqa: BLE001
+            LOGGER.exception("Error occurred while fetching device %s", device_id)
+            return
+        self.add_device(device)
+
+    async def wait_for_fetches(self) -> None:
+        """Wait until the pending device fetches are done."""
+        while self._fetches:
+            await asyncio.gather(*self._fetches.values(), return_exceptions=True)
+
+    def location_rooms(self, location_id: str) -> AbstractSet[str]:
+        """Return the ids of the rooms in a location."""
+        return self._location_rooms.get(location_id, _EMPTY)
+
+    def location_devices(self, location_id: str) -> AbstractSet[str]:
+        """Return the ids of the devices in a location."""
+        return self._location_devices.get(location_id, _EMPTY)
+
+    def room_devices(self, room_id: str) -> AbstractSet[str]:
+        """Return the ids of the devices in a room."""
+        return self._room_devices.get(room_id, _EMPTY)
+
+    def capability_devices(self, capability: Capability | str) -> AbstractSet[str]:
+        """Return the ids of the devices with a capability on any component."""
+        return self._capability_devices.get(capability, _EMPTY)
+
+    def category_devices(self, category: Category | str) -> AbstractSet[str]:
+        """Return the ids of the devices with a component of a category."""
+        return self._category_devices.get(category, _EMPTY)
+
+    def manufacturer_category_devices(
+        self, category: Category | str
+    ) -> AbstractSet[str]:
+        """Return the ids of the devices with a component of a category."""
+        return self._manufacturer_category_devices.get(category, _EMPTY)
+
+    def user_category_devices(self, category: Category | str) -> AbstractSet[str]:
+        """Return the ids of the devices with a component set to a category."""
+        return self._user_category_devices.get(category, _EMPTY)
+
+    def device_type_devices(self, device_type: DeviceType) -> AbstractSet[str]:
+        """Return the ids of the devices of a type."""
+        return self._device_type_devices.get(device_type, _EMPTY)
+
+    def query(  # noqa: PLR0913
+        self,
+        *,
+        location_id: str | None = None,
+        room_id: str | None = None,
+        device_type: DeviceType | None = None,
+        capability: Capability | str | None = None,
+        category: Category | str | None = None,
+        manufacturer_category: Category | str | None = None,
+        user_category: Category | str | None = None,
+        conditions: Iterable[Condition] = (),
+        state: StateStore | None = None,
+    ) -> set[str]:
+        """Return the ids of the devices matching all given criteria.
+
+        The smallest matching index is intersected with the others, and only
+        the devices left are checked against the conditions on their current
+        state, so the cost follows the size of the result instead of the
+        number of devices.
+        """
+        conditions = list(conditions)
+        if conditions and state is None:
+            msg = "A state store is required to query on conditions"
+            raise ValueError(msg)
+        criteria: list[tuple[dict[Any, set[str]], Any]] = [
+            (self._location_devices, location_id),
+            (self._room_devices, room_id),
+            (self._device_type_devices, device_type),
+            (self._capability_devices, capability),
+            (self._category_devices, category),
+            (self._manufacturer_category_devices, manufacturer_category),
+            (self._user_category_devices, user_category),
+        ]
+        candidates: list[AbstractSet[str]] = [
+            index.get(key, _EMPTY) for index, key in criteria if key is not None
+        ]
+        candidates.extend(
+            self._capability_devices.get(condition.capability, _EMPTY)
+            for condition in conditions
+        )
+        if not candidates:
+            result = set(self.devices)
+        else:
+            candidates.sort(key=len)
+            result = set(candidates[0])
+            for device_ids in candidates[1:]:
+                if not result:
+                    break
+                result.intersection_update(device_ids)
+        if conditions:
+            assert state is not None  # noqa: S101
+            result = {
+                device_id
+                for device_id in result
+                if all(condition.matches(state, device_id) for condition in conditions)
+            }
+        return result
+
+    @property
+    def hubs(self) -> AbstractSet[str]:
+        """Return the ids of the hubs."""
+        return self._hubs
+
+    def children(self, device_id: str) -> AbstractSet[str]:
+        """Return the ids of the devices with a device as parent or hub."""
+        return self._children.get(device_id, _EMPTY)
+
+    def descendants(self, device_id: str) -> set[str]:
+        """Return the ids of the children of a device and all of theirs."""
+        descendants: set[str] = set()
+        pending = [device_id]
+        while pending:
+            for child_id in self._children.get(pending.pop(), _EMPTY):
+                if child_id not in descendants:
+                    descendants.add(child_id)
+                    pending.append(child_id)
+        descendants.discard(device_id)
+        return descendants
@@ -0,0 +1,196 @@
+"""Tests for the SmartThings client."""
+
+import asyncio
+from dataclasses import fields
+
+from aiohttp import ClientConnectionError, ClientSession, TCPConnector
+from aiohttp.hdrs import METH_GET
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+from pysmartthings import (
+    DeviceEvent,
+    RequestMetrics,
+    SmartThings,
+    SmartThingsConnectionError,
+)
+from . import load_fixture
+
+from .const import HEADERS, MOCK_URL
+
+
+def test_positional_arguments() -> None:
+    """Test new options do not shift the positional constructor arguments."""
+    assert [field.name for field in fields(SmartThings) if field.init][:7] == [
+        "request_timeout",
+        "_close_session",
+        "_token",
+        "session",
+        "refresh_token_function",
+        "new_subscription_id_callback",
+        "max_connections_reached_callback",
+    ]
+
+
+async def test_custom_base_url(responses: aioresponses) -> None:
+    """Test requests are sent to a configured base URL."""
+    responses.get(
+        "http://localhost:8080/v1/locations",
+        status=200,
+        body=load_fixture("locations.json"),
+    )
+    async with (
+        ClientSession() as session,
+        SmartThings(session=session, base_url="http://localhost:8080") as client,
+    ):
+        client.authenticate("token")
+        assert len(await client.get_locations()) == 2
+    responses.assert_called_once_with(
+        "http://localhost:8080/v1/locations",
+        METH_GET,
+        headers=HEADERS,
+        params=None,
+        data=None,
+    )
+
+
+async def test_headers_follow_token(client: SmartThings) -> None:
+    """Test the request headers are reused until the token changes."""
+    headers = client._get_request_headers()
+    assert headers == HEADERS
+    assert client._get_request_headers() is headers
+    client.authenticate("new_token")
+    assert client._get_request_headers() == {
+        **HEADERS,
+        "Authorization": "Bearer new_token",
+    }
+
+
+async def test_own_session_connector(responses: aioresponses) -> None:
+    """Test the client tunes the connection pool of the session it creates."""
+    responses.get(
+        f"{MOCK_URL}/v1/locations",
+        status=200,
+        body=load_fixture("locations.json"),
+    )
+    async with SmartThings(connection_limit_per_host=5) as client:
+        client.authenticate("token")
+        await client.get_locations()
+        assert client.session is not None
+        connector = client.session.connector
+        assert isinstance(connector, TCPConnector)
+        assert connector.limit == 100
+        assert connector.limit_per_host == 5
+        assert connector.use_dns_cache
+    assert client.session.closed
+
+
+async def test_sse_session() -> None:
+    """Test the event stream gets its own session when the client owns them."""
+    async with SmartThings() as client:
+        sse_session = client._get_sse_session()
+        assert sse_session is not client.session
+        assert client._get_sse_session() is sse_session
+    assert sse_session.closed
+
+
+async def test_sse_session_provided(client: SmartThings) -> None:
+    """Test the event stream uses a provided session."""
+    assert client._get_sse_session() is client.session
+
+
+async def test_warm_up(client: SmartThings, responses: aioresponses) -> None:
+    """Test warming up opens connections concurrently."""
+    responses.head(MOCK_URL, status=404, repeat=True)
+    await client.warm_up(3)
+    assert len(responses.requests[("HEAD", URL(MOCK_URL))]) == 3
+
+
+async def test_warm_up_keep_alive(responses: aioresponses) -> None:
+    """Test connections are kept warm until the client is closed."""
+    responses.head(MOCK_URL, status=404, repeat=True)
+    async with SmartThings() as client:
+        await client.warm_up(2, keep_alive_interval=0.01)
+        await asyncio.sleep(0.035)
+    calls = len(responses.requests[("HEAD", URL(MOCK_URL))])
+    assert calls >= 6
+    await asyncio.sleep(0.03)
+    assert len(responses.requests[("HEAD", URL(MOCK_URL))]) == calls
+
+
+async def test_request_callback(client: SmartThings, responses: aioresponses) -> None:
+    """Test metrics are passed to the request callback."""
+    metrics: list[RequestMetrics] = []
+    client.request_callback = metrics.append
+    responses.get(
+        f"{MOCK_URL}/v1/devices/440063de-a200-40b5-8a6b-f3399eaa0370/status",
+        status=200,
+        body=load_fixture("device_status/base_lock.json"),
+    )
+    await client.get_device_status("440063de-a200-40b5-8a6b-f3399eaa0370")
+    assert len(metrics) == 1
+    request = metrics[0]
+    assert request.method == METH_GET
+    assert request.endpoint == "v1/devices/{id}/status"
+    assert request.status == 200
+    assert request.bytes_received == len(load_fixture("device_status/base_lock.json"))
+    assert request.connect is None
+    assert request.time_to_first_byte is not None
+    assert 0 <= request.time_to_first_byte <= request.total
+
+
+async def test_request_callback_failed_request(
+    client: SmartThings, responses: aioresponses
+) -> None:
+    """Test requests that fail to connect are passed to the request callback."""
+    metrics: list[RequestMetrics] = []
+    client.request_callback = metrics.append
+    responses.get(f"{MOCK_URL}/v1/locations", exception=ClientConnectionError())
+    with pytest.raises(SmartThingsConnectionError):
+        await client.get_locations()
+    assert len(metrics) == 1
+    request = metrics[0]
+    assert request.endpoint == "v1/locations"
+    assert request.status is None
+    assert request.bytes_received == 0
+    assert request.time_to_first_byte is None
+    assert request.total >= 0
+
+
+async def test_request_callback_error(
+    client: SmartThings, responses: aioresponses
+) -> None:
+    """Test an error in the request callback doesn't fail the request."""
+
+    def request_callback(_: RequestMetrics) -> None:
+        raise RuntimeError
+
+    client.request_callback = request_callback
+    responses.get(
+        f"{MOCK_URL}/v1/locations",
+        status=200,
+        body=load_fixture("locations.json"),
+    )
+    assert len(await client.get_locations()) == 2
+
+
+async def test_trace_config() -> None:
+    """Test sessions created by the client only trace requests when needed."""
+    async with SmartThings()._create_session() as session:
+        assert not session.trace_configs
+    async with SmartThings(request_callback=print)._create_session() as session:
+        assert session.trace_configs
+
+
+async def test_raw_event_callback_error(client: SmartThings) -> None:
+    """Test an error in the raw event callback doesn't stop dispatching."""
+
+    def raw_event_callback(*_: str) -> None:
+        raise OSError
+
+    events: list[DeviceEvent] = []
+    client.raw_event_callback = raw_event_callback
+    client.add_unspecified_device_event_listener(events.append)
+    assert client._dispatch_event("DEVICE_EVENT", load_fixture("event.json"))
+    assert len(events) == 1
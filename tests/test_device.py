@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import UTC, datetime
 import logging
 import re
 from typing import Any, TYPE_CHECKING
 
 import pytest
+from aiohttp import ClientError
 from aiohttp.hdrs import METH_GET, METH_POST
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
+import orjson
 from yarl import URL
 
-from pysmartthings import SmartThings, Capability, Command, SmartThingsCommandError
+from pysmartthings import (
+    Capability,
+    Command,
+    DeviceEvent,
+    SmartThings,
+    SmartThingsAuthenticationFailedError,
+    SmartThingsCommandError,
+)
 from . import load_fixture, load_json_fixture
 
 from .const import MOCK_URL, HEADERS
@@ -61,7 +72,7 @@ async def test_fetching_devices(
         METH_GET,
         headers=HEADERS,
         params={},
-        json=None,
+        data=None,
     )
 
 
@@ -96,7 +107,7 @@ async def test_fetching_specific_devices(
         METH_GET,
         headers=HEADERS,
         params=params,
-        json=None,
+        data=None,
     )
 
 
@@ -117,7 +128,7 @@ async def test_fetching_single_device(
         METH_GET,
         headers=HEADERS,
         params=None,
-        json=None,
+        data=None,
     )
 
 
@@ -219,7 +230,7 @@ async def test_fetching_status_of_single_device(
         METH_GET,
         headers=HEADERS,
         params=None,
-        json=None,
+        data=None,
     )
 
 
@@ -243,19 +254,103 @@ async def test_fetching_health(
         METH_GET,
         headers=HEADERS,
         params=None,
-        json=None,
+        data=None,
     )
 
 
+async def test_fetching_health_of_devices(
+    client: SmartThings,
+    responses: aioresponses,
+) -> None:
+    """Test getting health state of devices as the requests complete."""
+    device_ids = [
+        "440063de-a200-40b5-8a6b-f3399eaa0370",
+        "612ab3c2-3bb0-48f7-b2c0-15b169cb2fc3",
+        "7905bc7a-0633-4d80-a95b-45d59f1393a5",
+    ]
+    health = load_json_fixture("health.json")
+    for delay, device_id in zip([0.03, 0.0, 0.01], device_ids, strict=True):
+
+        async def callback(
+            *_: Any, device_id: str = device_id, delay: float = delay, **__: Any
+        ) -> CallbackResult:
+            await asyncio.sleep(delay)
+            return CallbackResult(payload={**health, "deviceId": device_id})
+
+        responses.get(
+            f"{MOCK_URL}/v1/devices/{device_id}/health",
+            callback=callback,
+        )
+    assert [
+        device_health.device_id
+        async for device_health in client.get_devices_health(device_ids, concurrency=2)
+    ] == [
+        "612ab3c2-3bb0-48f7-b2c0-15b169cb2fc3",
+        "7905bc7a-0633-4d80-a95b-45d59f1393a5",
+        "440063de-a200-40b5-8a6b-f3399eaa0370",
+    ]
+
+
+async def test_fetching_health_of_devices_with_failure(
+    client: SmartThings,
+    responses: aioresponses,
+) -> None:
+    """Test a device whose health can't be retrieved is skipped."""
+    health = load_json_fixture("health.json")
+    responses.get(
+        f"{MOCK_URL}/v1/devices/440063de-a200-40b5-8a6b-f3399eaa0370/health",
+        status=200,
+        payload={**health, "deviceId": "440063de-a200-40b5-8a6b-f3399eaa0370"},
+    )
+    responses.get(
+        f"{MOCK_URL}/v1/devices/612ab3c2-3bb0-48f7-b2c0-15b169cb2fc3/health",
+        status=404,
+        body="Not Found",
+    )
+    responses.get(
+        f"{MOCK_URL}/v1/devices/7905bc7a-0633-4d80-a95b-45d59f1393a5/health",
+        exception=ClientError(),
+    )
+    assert [
+        device_health.device_id
+        async for device_health in client.get_devices_health(
+            [
+                "440063de-a200-40b5-8a6b-f3399eaa0370",
+                "612ab3c2-3bb0-48f7-b2c0-15b169cb2fc3",
+                "7905bc7a-0633-4d80-a95b-45d59f1393a5",
+            ]
+        )
+    ] == ["440063de-a200-40b5-8a6b-f3399eaa0370"]
+
+
+async def test_fetching_health_of_devices_unauthorized(
+    client: SmartThings,
+    responses: aioresponses,
+) -> None:
+    """Test a failed authentication ends fetching the health of devices."""
+    device_ids = [
+        "440063de-a200-40b5-8a6b-f3399eaa0370",
+        "612ab3c2-3bb0-48f7-b2c0-15b169cb2fc3",
+        "7905bc7a-0633-4d80-a95b-45d59f1393a5",
+    ]
+    for device_id in device_ids:
+        responses.get(f"{MOCK_URL}/v1/devices/{device_id}/health", status=401)
+    with pytest.raises(SmartThingsAuthenticationFailedError):
+        async for _ in client.get_devices_health(device_ids):
+            pass
+
+
 @pytest.mark.parametrize(
     ("capability", "command", "argument", "fixture"),
     [
+        (Capability.SWITCH, Command.ON, None, "switch_on"),
+        (Capability.SWITCH_LEVEL, Command.SET_LEVEL, [50, 2], "set_level"),
         (
             Capability.COLOR_TEMPERATURE,
             Command.SET_COLOR_TEMPERATURE,
             3000,
             "set_color_temperature",
-        )
+        ),
     ],
 )
 async def test_executing_command(
@@ -278,9 +373,9 @@ async def test_executing_command(
     responses.assert_called_once_with(
         f"{MOCK_URL}/v1/devices/440063de-a200-40b5-8a6b-f3399eaa0370/commands",
         METH_POST,
-        headers=HEADERS,
+        headers={**HEADERS, "Content-Type": "application/json"},
         params=None,
-        json=load_json_fixture(f"device_commands/{fixture}.json"),
+        data=orjson.dumps(load_json_fixture(f"device_commands/{fixture}.json")),
     )
 
 
@@ -382,7 +477,7 @@ async def test_fetching_multiple_pages(
         METH_GET,
         headers=HEADERS,
         params={},
-        json=None,
+        data=None,
     )
     responses.assert_called_with(
         f"{MOCK_URL}/v1/devices",
@@ -392,7 +487,7 @@ async def test_fetching_multiple_pages(
             "max": 200,
             "page": 1,
         },
-        json=None,
+        data=None,
     )
 
 
@@ -416,7 +511,7 @@ async def test_fetching_multiple_pages_raw(
         METH_GET,
         headers=HEADERS,
         params={},
-        json=None,
+        data=None,
     )
     responses.assert_called_with(
         f"{MOCK_URL}/v1/devices",
@@ -426,5 +521,58 @@ async def test_fetching_multiple_pages_raw(
             "max": 200,
             "page": 1,
         },
-        json=None,
+        data=None,
+    )
+
+
+async def test_status_identifiers_are_canonical(
+    client: SmartThings,
+    responses: aioresponses,
+) -> None:
+    """Test repeated identifiers are shared between statuses and events."""
+    for _ in range(2):
+        responses.get(
+            f"{MOCK_URL}/v1/devices/440063de-a200-40b5-8a6b-f3399eaa0370/status",
+            status=200,
+            body=load_fixture("device_status/da_ref_normal_01011.json"),
+        )
+    first, second = [
+        await client.get_device_status("440063de-a200-40b5-8a6b-f3399eaa0370")
+        for _ in range(2)
+    ]
+    units = [
+        [
+            status.unit
+            for capabilities in components.values()
+            for attributes in capabilities.values()
+            for status in attributes.values()
+            if status.unit == "min"
+        ]
+        for components in (first, second)
+    ]
+    assert units[0]
+    assert all(a is b for a, b in zip(*units, strict=True))
+
+    events: list[DeviceEvent] = []
+    client.add_unspecified_device_event_listener(events.append)
+    for _ in range(2):
+        client._dispatch_event("DEVICE_EVENT", load_fixture("event.json"))
+    assert events[0].component_id is events[1].component_id
+
+
+async def test_status_timestamp_parsed_on_access(
+    client: SmartThings,
+    responses: aioresponses,
+) -> None:
+    """Test status timestamps are only parsed when read."""
+    responses.get(
+        f"{MOCK_URL}/v1/devices/440063de-a200-40b5-8a6b-f3399eaa0370/status",
+        status=200,
+        body=load_fixture("device_status/fake.json"),
     )
+    status = (await client.get_device_status("440063de-a200-40b5-8a6b-f3399eaa0370"))[
+        "main"
+    ]["fakeCapability"]["fakeAttribute"]
+    assert status.__dict__["_timestamp"] == "2024-12-31T09:18:21.859Z"
+    assert status.timestamp == datetime(2024, 12, 31, 9, 18, 21, 859000, tzinfo=UTC)
+    assert status.__dict__["_timestamp"] is status.timestamp
@@ -0,0 +1,113 @@
+"""Tests for the durable event log."""
+
+import asyncio
+from pathlib import Path
+
+from aioresponses import aioresponses
+import orjson
+
+from pysmartthings import Attribute, Capability, EventLog, SmartThings
+from . import load_fixture, load_json_fixture
+
+from .const import MOCK_URL
+
+DEVICE_ID = "440063de-a200-40b5-8a6b-f3399eaa0370"
+
+
+def files(directory: Path) -> list[str]:
+    """Return the names of the files in a directory."""
+    return sorted(path.name for path in directory.iterdir())
+
+
+def switch(event_log: EventLog) -> str | None:
+    """Return the switch value of the device in the snapshot of a log."""
+    status = event_log.snapshot.state.get_status(
+        DEVICE_ID, Capability.SWITCH, Attribute.SWITCH
+    )
+    return None if status is None else str(status.value)
+
+
+async def test_replay_and_compaction(client: SmartThings, tmp_path: Path) -> None:
+    """Test restoring the state from the log and from a compacted snapshot."""
+    event_log = EventLog(tmp_path)
+    await event_log.start(client)
+    client._dispatch_event("DEVICE_EVENT", load_fixture("event.json"))
+    assert switch(event_log) == "on"
+    await event_log.close()
+    assert client.raw_event_callback is None
+    assert files(tmp_path) == ["events.1.log"]
+
+    event_log = EventLog(tmp_path)
+    await event_log.start(client)
+    assert switch(event_log) == "on"
+    await event_log.compact()
+    await event_log.close()
+    assert files(tmp_path) == ["events.3.log", "snapshot.3.json"]
+
+    event_log = EventLog(tmp_path)
+    await event_log.start(client)
+    assert switch(event_log) == "on"
+    await event_log.close()
+
+
+async def test_compaction_waits_for_fetches(
+    client: SmartThings, responses: aioresponses, tmp_path: Path
+) -> None:
+    """Test a device fetched for a logged lifecycle event is compacted."""
+
+    async def callback(*_: object, **__: object) -> None:
+        await asyncio.sleep(0.01)
+
+    responses.get(
+        f"{MOCK_URL}/v1/devices/{DEVICE_ID}",
+        status=200,
+        body=load_fixture("device.json"),
+        callback=callback,
+    )
+    event = load_json_fixture("new_device_event.json")
+    event["deviceLifecycleEvent"]["deviceId"] = DEVICE_ID
+    event_log = EventLog(tmp_path)
+    await event_log.start(client)
+    client._dispatch_event(
+        "DEVICE_LIFECYCLE_EVENT",
+        orjson.dumps(event).decode(),  # pylint: disable=no-member
+    )
+    await event_log.compact()
+    await event_log.close()
+    assert files(tmp_path) == ["events.2.log", "snapshot.2.json"]
+
+    event_log = EventLog(tmp_path)
+    snapshot = await event_log.start(client)
+    assert DEVICE_ID in snapshot.topology.devices
+    await event_log.close()
+
+
+async def test_incomplete_event(client: SmartThings, tmp_path: Path) -> None:
+    """Test an event cut short by a crash is ignored."""
+    event_log = EventLog(tmp_path)
+    await event_log.start(client)
+    client._dispatch_event("DEVICE_EVENT", load_fixture("event.json"))
+    await event_log.close()
+    with (tmp_path / "events.1.log").open("ab") as file:
+        file.write(b'["DEVICE_EVENT","{')
+
+    event_log = EventLog(tmp_path)
+    await event_log.start(client)
+    assert switch(event_log) == "on"
+    await event_log.close()
+
+
+async def test_batched_sync(client: SmartThings, tmp_path: Path) -> None:
+    """Test the log is written once enough events are pending."""
+    event_log = EventLog(tmp_path, sync_interval=60, sync_events=2)
+    await event_log.start(client)
+    path = tmp_path / "events.1.log"
+    client._dispatch_event("DEVICE_EVENT", load_fixture("event.json"))
+    await event_log.sync()
+    assert path.read_bytes().count(b"\n") == 1
+    client._dispatch_event("CONTROL_EVENT", "welcome")
+    client._dispatch_event("DEVICE_EVENT", load_fixture("event.json"))
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert path.read_bytes().count(b"\n") == 3
+    await event_log.close()
@@ -0,0 +1,70 @@
+"""Tests for dispatching SmartThings events."""
+
+import time
+
+import pytest
+
+from pysmartthings import Capability, DeviceEvent, Lifecycle, SmartThings
+from . import load_fixture
+
+
+async def test_event_stream_stats(client: SmartThings) -> None:
+    """Test the event stream counters."""
+    assert client._dispatch_event("DEVICE_EVENT", load_fixture("event.json"))
+    assert client._dispatch_event(
+        "DEVICE_HEALTH_EVENT", load_fixture("device_health_event.json")
+    )
+    assert client._dispatch_event("CONTROL_EVENT", "welcome")
+    assert not client._dispatch_event("CONTROL_EVENT", "goodbye")
+    stats = client.event_stream_stats
+    assert stats.events == 4
+    assert stats.events_by_type == {
+        "DEVICE_EVENT": 1,
+        "DEVICE_HEALTH_EVENT": 1,
+        "CONTROL_EVENT": 2,
+    }
+    assert stats.decode_time > 0
+    assert stats.lag is not None
+    assert stats.max_lag >= stats.lag > 0
+    assert stats.events_per_second > 0
+
+
+async def test_failing_listener_is_isolated(
+    client: SmartThings, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a failing listener does not stop the listeners after it."""
+    events: list[DeviceEvent] = []
+
+    def fail(_: DeviceEvent) -> None:
+        raise ValueError
+
+    client.add_unspecified_device_event_listener(fail)
+    client.add_device_event_listener(
+        "440063de-a200-40b5-8a6b-f3399eaa0370", events.append
+    )
+    client.add_device_capability_event_listener(
+        "440063de-a200-40b5-8a6b-f3399eaa0370",
+        "main",
+        Capability.SWITCH,
+        events.append,
+    )
+    client._dispatch_event("DEVICE_EVENT", load_fixture("event.json"))
+    assert len(events) == 2
+    assert "Error occurred in listener" in caplog.text
+
+
+async def test_slow_listener(
+    client: SmartThings, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test listeners slower than the threshold are reported."""
+    created: list[str] = []
+    client.slow_listener_threshold = 0.01
+    client.add_device_lifecycle_event_listener(Lifecycle.CREATE, created.append)
+    client.add_device_lifecycle_event_listener(
+        Lifecycle.CREATE, lambda _: time.sleep(0.02)
+    )
+    client._dispatch_event(
+        "DEVICE_LIFECYCLE_EVENT", load_fixture("new_device_event.json")
+    )
+    assert created == ["46b0958e-4a92-40f3-b531-eb60c5d1aa7a"]
+    assert caplog.text.count("seconds to process event") == 1
@@ -0,0 +1,112 @@
+"""Tests for the device health index."""
+
+from aioresponses import aioresponses
+import orjson
+
+from pysmartthings import (
+    DeviceHealthEvent,
+    DeviceResponse,
+    HealthIndex,
+    HealthStatus,
+    SmartThings,
+    Topology,
+)
+from . import load_fixture, load_json_fixture
+
+from .const import MOCK_URL
+
+
+async def test_health_index(client: SmartThings, responses: aioresponses) -> None:
+    """Test seeding the health index and updating it from events."""
+    health = load_json_fixture("health.json")
+    device_ids = [
+        "612ab3c2-3bb0-48f7-b2c0-15b169cb2fc3",
+        "7905bc7a-0633-4d80-a95b-45d59f1393a5",
+    ]
+    for device_id, state in zip(device_ids, ["ONLINE", "OFFLINE"], strict=True):
+        responses.get(
+            f"{MOCK_URL}/v1/devices/{device_id}/health",
+            status=200,
+            payload={**health, "deviceId": device_id, "state": state},
+        )
+    index = HealthIndex()
+    index.listen(client)
+    await index.load(client, device_ids)
+    assert len(index) == 2
+    assert index.online == {"612ab3c2-3bb0-48f7-b2c0-15b169cb2fc3"}
+    assert index.offline == {"7905bc7a-0633-4d80-a95b-45d59f1393a5"}
+    assert not index.unhealthy
+
+    client._dispatch_event(
+        "DEVICE_HEALTH_EVENT", load_fixture("device_health_event.json")
+    )
+    assert index.status("7905bc7a-0633-4d80-a95b-45d59f1393a5") is HealthStatus.ONLINE
+    assert index.devices(HealthStatus.ONLINE) == set(device_ids)
+    assert not index.offline
+
+    index.remove("612ab3c2-3bb0-48f7-b2c0-15b169cb2fc3")
+    assert "612ab3c2-3bb0-48f7-b2c0-15b169cb2fc3" not in index
+    assert index.status("612ab3c2-3bb0-48f7-b2c0-15b169cb2fc3") is None
+    assert index.online == {"7905bc7a-0633-4d80-a95b-45d59f1393a5"}
+
+
+async def test_unspecified_availability_listener(client: SmartThings) -> None:
+    """Test listening to availability events of all devices."""
+    events: list[DeviceHealthEvent] = []
+    remove = client.add_unspecified_device_availability_event_listener(events.append)
+    client._dispatch_event(
+        "DEVICE_HEALTH_EVENT", load_fixture("device_health_event.json")
+    )
+    remove()
+    client._dispatch_event(
+        "DEVICE_HEALTH_EVENT", load_fixture("device_health_event.json")
+    )
+    assert len(events) == 1
+    assert events[0].device_id == "7905bc7a-0633-4d80-a95b-45d59f1393a5"
+
+
+async def test_hub_health_propagation(client: SmartThings) -> None:
+    """Test a hub going offline takes the devices below it along."""
+    topology = Topology()
+    for device in DeviceResponse.from_json(load_fixture("devices_10.json")).items:
+        topology.add_device(device)
+    index = HealthIndex(topology=topology)
+    index.update_many(topology.devices, HealthStatus.ONLINE)
+    index.listen(client)
+    event = load_json_fixture("device_health_event.json")
+    event["deviceHealthEvent"].update(
+        deviceId="6a2d07a4-dd77-48bc-9acf-017029aaf099", status="OFFLINE"
+    )
+    client._dispatch_event("DEVICE_HEALTH_EVENT", orjson.dumps(event).decode())  # pylint: disable=no-member
+    assert len(index.offline) == 14
+    assert len(index.online) == 3
+
+    event["deviceHealthEvent"]["status"] = "ONLINE"
+    client._dispatch_event("DEVICE_HEALTH_EVENT", orjson.dumps(event).decode())  # pylint: disable=no-member
+    assert not index.offline
+    assert len(index.online) == 17
+
+
+async def test_hub_health_restore(client: SmartThings) -> None:
+    """Test devices below a hub get their own status back when it returns."""
+    topology = Topology()
+    for device in DeviceResponse.from_json(load_fixture("devices_10.json")).items:
+        topology.add_device(device)
+    hub_id = "6a2d07a4-dd77-48bc-9acf-017029aaf099"
+    child_id, other_id, *children = sorted(topology.descendants(hub_id))
+    index = HealthIndex(topology=topology)
+    index.update_many(children, HealthStatus.ONLINE)
+    index.update(other_id, HealthStatus.UNHEALTHY)
+    index.listen(client)
+    event = load_json_fixture("device_health_event.json")
+    for device_id, status in (
+        (hub_id, "OFFLINE"),
+        (hub_id, "UNHEALTHY"),
+        (child_id, "OFFLINE"),
+        (hub_id, "ONLINE"),
+    ):
+        event["deviceHealthEvent"].update(deviceId=device_id, status=status)
+        client._dispatch_event("DEVICE_HEALTH_EVENT", orjson.dumps(event).decode())  # pylint: disable=no-member
+    assert index.offline == {child_id}
+    assert index.unhealthy == {other_id}
+    assert index.online == {hub_id, *children}
@@ -25,7 +25,7 @@ async def test_fetching_all_locations(
         METH_GET,
         headers=HEADERS,
         params=None,
-        json=None,
+        data=None,
     )
 
 
@@ -46,5 +46,5 @@ async def test_fetching_single_location(
         METH_GET,
         headers=HEADERS,
         params=None,
-        json=None,
+        data=None,
     )
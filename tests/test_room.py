@@ -27,7 +27,7 @@ async def test_fetching_all_rooms(
         METH_GET,
         headers=HEADERS,
         params=None,
-        json=None,
+        data=None,
     )
 
 
@@ -54,5 +54,5 @@ async def test_fetching_single_room(
         METH_GET,
         headers=HEADERS,
         params=None,
-        json=None,
+        data=None,
     )
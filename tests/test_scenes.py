@@ -26,7 +26,7 @@ async def test_fetching_all_scenes(
         METH_GET,
         headers=HEADERS,
         params={},
-        json=None,
+        data=None,
     )
 
 
@@ -46,7 +46,7 @@ async def test_fetch_scenes_for_location(
         METH_GET,
         headers=HEADERS,
         params={"locationId": "397678e5-9995-4a39-9d9f-ae6ba310236b"},
-        json=None,
+        data=None,
     )
 
 
@@ -66,5 +66,5 @@ async def test_executing_scene(
         METH_POST,
         headers=HEADERS,
         params=None,
-        json=None,
+        data=None,
     )
@@ -26,7 +26,7 @@ async def test_deleting_smart_app(
         METH_DELETE,
         headers={**HEADERS, "Authorization": "Bearer abcabcabcabc"},
         params=None,
-        json=None,
+        data=None,
     )
 
 
@@ -46,7 +46,7 @@ async def test_deleting_installed_app(
         METH_DELETE,
         headers={**HEADERS, "Authorization": "Bearer abcabcabcabc"},
         params=None,
-        json=None,
+        data=None,
     )
 
 
@@ -72,5 +72,5 @@ async def test_get_installed_app(
         METH_GET,
         headers={**HEADERS, "Authorization": "Bearer abcabcabcabc"},
         params=None,
-        json=None,
+        data=None,
     )
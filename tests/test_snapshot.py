@@ -0,0 +1,135 @@
+"""Tests for the on-disk snapshot of an account."""
+
+from pathlib import Path
+import re
+
+from aioresponses import aioresponses
+import orjson
+
+from pysmartthings import (
+    Attribute,
+    Capability,
+    Device,
+    DeviceResponse,
+    DeviceStatus,
+    SmartThings,
+    Snapshot,
+    StateStore,
+    Topology,
+)
+from . import load_fixture
+
+from .const import MOCK_URL
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def load_snapshot() -> Snapshot:
+    """Return a snapshot of all device and status fixtures."""
+    topology = Topology()
+    for path in sorted(FIXTURES.glob("devices_[0-9]*.json")):
+        for device in DeviceResponse.from_json(path.read_bytes()).items:
+            topology.add_device(device)
+    state = StateStore()
+    for device_id, path in zip(
+        topology.devices,
+        sorted((FIXTURES / "device_status").glob("*.json")),
+        strict=False,
+    ):
+        state.set_device_status(
+            device_id, DeviceStatus.from_json(path.read_bytes()).components
+        )
+    return Snapshot(topology, state)
+
+
+def test_round_trip() -> None:
+    """Test devices and statuses are restored from a snapshot."""
+    snapshot = load_snapshot()
+    restored = Snapshot.loads(snapshot.dumps())
+    assert restored is not None
+    assert restored.topology.devices == snapshot.topology.devices
+    assert restored.state.statuses == snapshot.state.statuses
+    assert restored.topology.hubs == snapshot.topology.hubs
+
+
+def test_other_api_version() -> None:
+    """Test a snapshot of another API version is ignored."""
+    data = orjson.loads(load_snapshot().dumps())  # pylint: disable=no-member
+    data["version"] = 20200101
+    assert Snapshot.loads(orjson.dumps(data)) is None  # pylint: disable=no-member
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    """Test saving and loading a snapshot."""
+    path = tmp_path / "snapshot.json"
+    assert Snapshot.load(path) is None
+    snapshot = load_snapshot()
+    snapshot.save(path)
+    restored = Snapshot.load(path)
+    assert restored is not None
+    assert restored.topology.devices == snapshot.topology.devices
+    assert [item.name for item in tmp_path.iterdir()] == ["snapshot.json"]
+
+    path.write_bytes(b"{")
+    assert Snapshot.load(path) is None
+
+
+async def test_refresh(client: SmartThings, responses: aioresponses) -> None:
+    """Test refreshing a snapshot and keeping it up to date."""
+    device = Device.from_json(load_fixture("device.json"))
+    snapshot = Snapshot()
+    snapshot.topology.add_device(device)
+    snapshot.state.set_device_status(device.device_id, {})
+    snapshot.listen(client)
+
+    responses.get(
+        f"{MOCK_URL}/v1/devices",
+        status=200,
+        body=load_fixture("devices_10.json"),
+    )
+    responses.get(
+        re.compile(rf"{MOCK_URL}/v1/devices/[^/]+/status"),
+        status=200,
+        body=load_fixture("device_status/27_smart_monitor_m5.json"),
+        repeat=True,
+    )
+    await snapshot.refresh(client)
+    assert device.device_id not in snapshot.topology.devices
+    assert device.device_id not in snapshot.state.statuses
+    assert len(snapshot.topology.devices) == 17
+    assert snapshot.state.statuses.keys() == snapshot.topology.devices.keys()
+
+    client._dispatch_event("DEVICE_EVENT", load_fixture("event.json"))
+    status = snapshot.state.get_status(
+        device.device_id, Capability.SWITCH, Attribute.SWITCH
+    )
+    assert status is not None
+    assert status.value == "on"
+
+
+async def test_refresh_with_failure(
+    client: SmartThings, responses: aioresponses
+) -> None:
+    """Test a device whose status can't be fetched doesn't stop a refresh."""
+    responses.get(
+        f"{MOCK_URL}/v1/devices",
+        status=200,
+        body=load_fixture("devices_10.json"),
+    )
+    responses.get(
+        f"{MOCK_URL}/v1/devices/6a6954ee-5784-4cce-aac6-fbe010adca07/status",
+        status=500,
+        body="Internal Server Error",
+    )
+    responses.get(
+        re.compile(rf"{MOCK_URL}/v1/devices/[^/]+/status"),
+        status=200,
+        body=load_fixture("device_status/27_smart_monitor_m5.json"),
+        repeat=True,
+    )
+    snapshot = Snapshot()
+    await snapshot.refresh(client)
+    assert len(snapshot.topology.devices) == 17
+    assert snapshot.state.statuses.keys() == snapshot.topology.devices.keys() - {
+        "6a6954ee-5784-4cce-aac6-fbe010adca07"
+    }
@@ -0,0 +1,64 @@
+"""Tests for the device state store."""
+
+from aioresponses import aioresponses
+import pytest
+
+from pysmartthings import (
+    Attribute,
+    Capability,
+    SmartThings,
+    SmartThingsAuthenticationFailedError,
+    StateStore,
+)
+from . import load_fixture
+
+from .const import MOCK_URL
+
+DEVICE_ID = "440063de-a200-40b5-8a6b-f3399eaa0370"
+
+
+async def test_state_store(client: SmartThings, responses: aioresponses) -> None:
+    """Test loading the state store and updating it from events."""
+    responses.get(
+        f"{MOCK_URL}/v1/devices/{DEVICE_ID}/status",
+        status=200,
+        body=load_fixture("device_status/27_smart_monitor_m5.json"),
+    )
+    state = StateStore()
+    state.listen(client)
+    await state.load(client, [DEVICE_ID])
+    status = state.get_status(DEVICE_ID, Capability.SWITCH, Attribute.SWITCH)
+    assert status is not None
+    assert status.value == "off"
+    timestamp = status.timestamp
+
+    client._dispatch_event("DEVICE_EVENT", load_fixture("event.json"))
+    assert status.value == "on"
+    assert status.timestamp == timestamp
+    assert state.get_status(DEVICE_ID, Capability.SWITCH, Attribute.SWITCH) is status
+
+    state.remove_device(DEVICE_ID)
+    assert state.get_status(DEVICE_ID, Capability.SWITCH, Attribute.SWITCH) is None
+
+
+async def test_event_for_unknown_device(client: SmartThings) -> None:
+    """Test an event adds the status of an unknown attribute."""
+    state = StateStore()
+    state.listen(client)
+    client._dispatch_event("DEVICE_EVENT", load_fixture("event.json"))
+    status = state.get_status(DEVICE_ID, Capability.SWITCH, Attribute.SWITCH)
+    assert status is not None
+    assert status.value == "on"
+    assert state.get_status(DEVICE_ID, Capability.SWITCH, "other") is None
+    assert (
+        state.get_status(DEVICE_ID, Capability.SWITCH, Attribute.SWITCH, "sub") is None
+    )
+
+
+async def test_load_unauthorized(client: SmartThings, responses: aioresponses) -> None:
+    """Test a failed authentication is raised when loading the statuses."""
+    responses.get(f"{MOCK_URL}/v1/devices/{DEVICE_ID}/status", status=401)
+    state = StateStore()
+    with pytest.raises(SmartThingsAuthenticationFailedError):
+        await state.load(client, [DEVICE_ID])
+    assert not state.statuses
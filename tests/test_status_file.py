@@ -0,0 +1,96 @@
+"""Tests for the memory-mapped status file."""
+
+from pathlib import Path
+
+import pytest
+
+from pysmartthings import (
+    Attribute,
+    Capability,
+    DeviceStatus,
+    StateStore,
+    StatusFile,
+)
+from . import load_fixture
+
+DEVICE_ID = "440063de-a200-40b5-8a6b-f3399eaa0370"
+OTHER_DEVICE_ID = "aaaaaaaa-a200-40b5-8a6b-f3399eaa0370"
+
+
+def load_state() -> StateStore:
+    """Return a state store with the status of two devices."""
+    state = StateStore()
+    state.set_device_status(
+        DEVICE_ID,
+        DeviceStatus.from_json(
+            load_fixture("device_status/27_smart_monitor_m5.json")
+        ).components,
+    )
+    state.set_device_status(
+        OTHER_DEVICE_ID,
+        DeviceStatus.from_json(
+            load_fixture("device_status/da_wm_wm_000001.json")
+        ).components,
+    )
+    return state
+
+
+def test_status_file(tmp_path: Path) -> None:
+    """Test reading every status back from a status file."""
+    path = tmp_path / "statuses"
+    state = load_state()
+    StatusFile.write(state, path)
+    with StatusFile(path) as status_file:
+        count = 0
+        for device_id, components in state.statuses.items():
+            for component, capabilities in components.items():
+                for capability, attributes in capabilities.items():
+                    for attribute, status in attributes.items():
+                        count += 1
+                        assert (
+                            status_file.get_status(
+                                device_id, capability, attribute, component
+                            )
+                            == status
+                        )
+        assert len(status_file) == count
+        assert status_file.get_status(DEVICE_ID, Capability.SWITCH, "other") is None
+        assert (
+            status_file.get_status("unknown", Capability.SWITCH, Attribute.SWITCH)
+            is None
+        )
+        assert (
+            status_file.get_status(
+                DEVICE_ID, Capability.SWITCH, Attribute.SWITCH, "sub"
+            )
+            is None
+        )
+
+
+def test_reload(tmp_path: Path) -> None:
+    """Test a reader sees a new version of the file after reloading."""
+    path = tmp_path / "statuses"
+    state = load_state()
+    StatusFile.write(state, path)
+    with StatusFile(path) as status_file:
+        assert status_file.reload() is False
+        status = state.get_status(DEVICE_ID, Capability.SWITCH, Attribute.SWITCH)
+        assert status is not None
+        status.value = "on"
+        StatusFile.write(state, path)
+        switch = status_file.get_status(DEVICE_ID, Capability.SWITCH, Attribute.SWITCH)
+        assert switch is not None
+        assert switch.value == "off"
+        assert status_file.reload() is True
+        switch = status_file.get_status(DEVICE_ID, Capability.SWITCH, Attribute.SWITCH)
+        assert switch is not None
+        assert switch.value == "on"
+    assert [item.name for item in tmp_path.iterdir()] == ["statuses"]
+
+
+def test_other_file(tmp_path: Path) -> None:
+    """Test opening a file that is not a status file."""
+    path = tmp_path / "statuses"
+    path.write_bytes(b"0" * 64)
+    with pytest.raises(ValueError, match="is not a status file"):
+        StatusFile(path)
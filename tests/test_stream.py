@@ -0,0 +1,93 @@
+"""Tests for recording and replaying the event stream."""
+
+from pathlib import Path
+import time
+
+from aioresponses import aioresponses
+import orjson
+
+from pysmartthings import (
+    DeviceEvent,
+    SmartThings,
+    StreamRecorder,
+    StreamReplayer,
+)
+from . import load_fixture
+
+SSE_URL = "https://spigot-regional.api.smartthings.com/sse/123"
+
+
+def event_stream() -> bytes:
+    """Return an event stream with two device events and a keepalive."""
+    data = orjson.dumps(orjson.loads(load_fixture("event.json")))  # pylint: disable=no-member
+    frame = b"event: DEVICE_EVENT\ndata: " + data + b"\n\n"
+    return frame + b": keepalive\n\n" + frame
+
+
+async def test_record_and_replay(
+    client: SmartThings, responses: aioresponses, tmp_path: Path
+) -> None:
+    """Test replaying a recorded stream dispatches the same events."""
+    responses.get(SSE_URL, status=200, body=event_stream())
+    events: list[DeviceEvent] = []
+    client.add_unspecified_device_event_listener(events.append)
+    path = tmp_path / "stream.jsonl"
+    recorder = StreamRecorder(path)
+    recorder.start(client)
+    assert client.session is not None
+    await client._internal_subscribe(client.session, SSE_URL)
+    recorder.close()
+    assert client.raw_stream_callback is None
+    assert len(events) == 2
+    assert len(path.read_bytes().splitlines()) == 8
+
+    assert await StreamReplayer(path, speed=None).replay(client) == 2
+    assert len(events) == 4
+    assert events[2] == events[0]
+
+
+async def test_paced_replay(client: SmartThings, tmp_path: Path) -> None:
+    """Test a replay follows the recorded pace divided by the speed."""
+    path = tmp_path / "stream.jsonl"
+    lines = event_stream().decode().splitlines(keepends=True)
+    path.write_bytes(
+        b"".join(
+            orjson.dumps([index * 0.1, line]) + b"\n"  # pylint: disable=no-member
+            for index, line in enumerate(lines)
+        )
+    )
+    start = time.monotonic()
+    assert await StreamReplayer(path, speed=10).replay(client) == 2
+    assert time.monotonic() - start >= 0.07
+
+
+async def test_replay_stops_at_goodbye(client: SmartThings, tmp_path: Path) -> None:
+    """Test a replay stops at an event that closes the connection."""
+    events: list[DeviceEvent] = []
+    client.add_unspecified_device_event_listener(events.append)
+    path = tmp_path / "stream.jsonl"
+    stream = event_stream().replace(
+        b": keepalive\n\n", b"event: CONTROL_EVENT\ndata: goodbye\n\n"
+    )
+    path.write_bytes(
+        b"".join(
+            orjson.dumps([0, line]) + b"\n"  # pylint: disable=no-member
+            for line in stream.decode().splitlines(keepends=True)
+        )
+    )
+    assert await StreamReplayer(path, speed=None).replay(client) == 2
+    assert len(events) == 1
+
+
+async def test_recorder_error(
+    client: SmartThings, responses: aioresponses, tmp_path: Path
+) -> None:
+    """Test an error while recording doesn't stop the stream."""
+    responses.get(SSE_URL, status=200, body=event_stream())
+    events: list[DeviceEvent] = []
+    client.add_unspecified_device_event_listener(events.append)
+    recorder = StreamRecorder(tmp_path / "missing" / "stream.jsonl")
+    client.raw_stream_callback = recorder.record
+    assert client.session is not None
+    await client._internal_subscribe(client.session, SSE_URL)
+    assert len(events) == 2
@@ -0,0 +1,263 @@
+"""Tests for the topology of an account."""
+
+import asyncio
+from typing import Any
+
+from aioresponses import CallbackResult, aioresponses
+import orjson
+import pytest
+
+from pysmartthings import (
+    Attribute,
+    Capability,
+    Category,
+    Condition,
+    DeviceEvent,
+    DeviceResponse,
+    DeviceType,
+    SmartThings,
+    StateStore,
+    Topology,
+)
+from . import load_fixture, load_json_fixture
+
+from .const import MOCK_URL
+
+LOCATION_ID = "6911ddf5-f0cb-4516-a06a-3a2a6ec22bca"
+HUB_ID = "6a2d07a4-dd77-48bc-9acf-017029aaf099"
+ROOM_ID = "bce1d0a8-cd33-4896-a5ad-05f50467c8db"
+
+
+def mock_account(responses: aioresponses) -> None:
+    """Mock the endpoints used to load the topology."""
+    responses.get(
+        f"{MOCK_URL}/v1/locations",
+        status=200,
+        payload={"items": [{"locationId": LOCATION_ID, "name": "Home"}]},
+    )
+    responses.get(
+        f"{MOCK_URL}/v1/locations/{LOCATION_ID}",
+        status=200,
+        payload={**load_json_fixture("location.json"), "locationId": LOCATION_ID},
+    )
+    responses.get(
+        f"{MOCK_URL}/v1/locations/{LOCATION_ID}/rooms",
+        status=200,
+        payload={
+            "items": [
+                {"roomId": ROOM_ID, "locationId": LOCATION_ID, "name": "Living room"}
+            ]
+        },
+    )
+    responses.get(
+        f"{MOCK_URL}/v1/devices",
+        status=200,
+        body=load_fixture("devices_10.json"),
+    )
+    responses.get(
+        f"{MOCK_URL}/v1/scenes",
+        status=200,
+        body=load_fixture("scenes.json"),
+    )
+
+
+async def test_load_topology(client: SmartThings, responses: aioresponses) -> None:
+    """Test loading and indexing the topology."""
+    mock_account(responses)
+    topology = await client.load_topology()
+    assert list(topology.locations) == [LOCATION_ID]
+    assert list(topology.rooms) == [ROOM_ID]
+    assert len(topology.devices) == 17
+    assert len(topology.scenes) == 2
+    assert topology.location_rooms(LOCATION_ID) == {ROOM_ID}
+    assert len(topology.location_devices(LOCATION_ID)) == 17
+    assert topology.room_devices(ROOM_ID) == {
+        "6a6954ee-5784-4cce-aac6-fbe010adca07",
+        "333b4955-5f0d-4a87-8ad8-9fe32607e1fb",
+        "01751e21-3609-ec2f-41af-1c8bc8d96c15",
+    }
+    assert len(topology.capability_devices(Capability.MOTION_SENSOR)) == 2
+    assert topology.category_devices(Category.HUB) == {HUB_ID}
+    assert len(topology.children(HUB_ID)) == 13
+    assert not topology.children("6a6954ee-5784-4cce-aac6-fbe010adca07")
+
+
+async def test_load_topology_rooms_before_devices(
+    client: SmartThings, responses: aioresponses
+) -> None:
+    """Test the rooms of a location are fetched without waiting for devices."""
+    rooms_requested = asyncio.Event()
+
+    async def devices_callback(*_: Any, **__: Any) -> CallbackResult:
+        await asyncio.wait_for(rooms_requested.wait(), 1)
+        return CallbackResult(body=load_fixture("devices_10.json"))
+
+    async def rooms_callback(*_: Any, **__: Any) -> None:
+        rooms_requested.set()
+
+    responses.get(f"{MOCK_URL}/v1/devices", callback=devices_callback)
+    responses.get(
+        f"{MOCK_URL}/v1/locations/{LOCATION_ID}/rooms",
+        status=200,
+        payload={"items": []},
+        callback=rooms_callback,
+    )
+    mock_account(responses)
+    topology = await client.load_topology()
+    assert len(topology.devices) == 17
+
+
+async def test_remove_device(client: SmartThings, responses: aioresponses) -> None:
+    """Test removing a device drops it from every index."""
+    mock_account(responses)
+    topology = await client.load_topology()
+    device = topology.remove_device("333b4955-5f0d-4a87-8ad8-9fe32607e1fb")
+    assert device is not None
+    assert "333b4955-5f0d-4a87-8ad8-9fe32607e1fb" not in topology.devices
+    assert len(topology.location_devices(LOCATION_ID)) == 16
+    assert len(topology.room_devices(ROOM_ID)) == 2
+    assert len(topology.children(HUB_ID)) == 12
+    assert topology.remove_device("333b4955-5f0d-4a87-8ad8-9fe32607e1fb") is None
+    topology.add_device(device)
+    assert len(topology.children(HUB_ID)) == 13
+
+
+def lifecycle_event(fixture: str, device_id: str) -> str:
+    """Return a device lifecycle event fixture for another device."""
+    event = load_json_fixture(fixture)
+    event["deviceLifecycleEvent"]["deviceId"] = device_id
+    return orjson.dumps(event).decode()  # pylint: disable=no-member
+
+
+async def test_lifecycle_events(client: SmartThings, responses: aioresponses) -> None:
+    """Test lifecycle events keep the devices up to date."""
+    mock_account(responses)
+    topology = await client.load_topology()
+    topology.listen(client)
+
+    responses.get(
+        f"{MOCK_URL}/v1/devices/440063de-a200-40b5-8a6b-f3399eaa0370",
+        status=200,
+        body=load_fixture("device.json"),
+    )
+    client._dispatch_event(
+        "DEVICE_LIFECYCLE_EVENT",
+        lifecycle_event(
+            "new_device_event.json", "440063de-a200-40b5-8a6b-f3399eaa0370"
+        ),
+    )
+    await topology.wait_for_fetches()
+    assert "440063de-a200-40b5-8a6b-f3399eaa0370" in topology.devices
+    assert topology.location_devices("88a3a314-f0c8-40b4-bb44-44ba06c9c42f") == {
+        "440063de-a200-40b5-8a6b-f3399eaa0370"
+    }
+
+    client._dispatch_event(
+        "DEVICE_LIFECYCLE_EVENT",
+        lifecycle_event("room_move_event.json", "6a6954ee-5784-4cce-aac6-fbe010adca07"),
+    )
+    assert (
+        topology.devices["6a6954ee-5784-4cce-aac6-fbe010adca07"].room_id
+        == "83ca5360-1938-4e7d-9eac-bec26b283e82"
+    )
+    assert topology.room_devices("83ca5360-1938-4e7d-9eac-bec26b283e82") == {
+        "6a6954ee-5784-4cce-aac6-fbe010adca07"
+    }
+    assert len(topology.room_devices(ROOM_ID)) == 2
+
+    client._dispatch_event(
+        "DEVICE_LIFECYCLE_EVENT",
+        lifecycle_event("removed_device_event.json", HUB_ID),
+    )
+    assert HUB_ID not in topology.devices
+    assert not topology.category_devices(Category.HUB)
+
+
+async def test_deleted_while_fetching(
+    client: SmartThings, responses: aioresponses
+) -> None:
+    """Test a device deleted while being fetched is not added."""
+    topology = Topology()
+    topology.listen(client)
+    responses.get(
+        f"{MOCK_URL}/v1/devices/440063de-a200-40b5-8a6b-f3399eaa0370",
+        status=200,
+        body=load_fixture("device.json"),
+    )
+    for fixture in ("update_device_event.json", "removed_device_event.json"):
+        client._dispatch_event(
+            "DEVICE_LIFECYCLE_EVENT",
+            lifecycle_event(fixture, "440063de-a200-40b5-8a6b-f3399eaa0370"),
+        )
+    await topology.wait_for_fetches()
+    assert not topology.devices
+
+
+def test_hubs_and_descendants() -> None:
+    """Test indexing devices below their hub."""
+    topology = Topology()
+    for fixture in ("devices_10.json", "devices_18.json"):
+        for device in DeviceResponse.from_json(load_fixture(fixture)).items:
+            topology.add_device(device)
+    assert HUB_ID in topology.hubs
+    assert topology.descendants(HUB_ID) == set(topology.children(HUB_ID))
+    assert len(topology.descendants(HUB_ID)) == 13
+    matter_device = next(
+        device for device in topology.devices.values() if device.matter is not None
+    )
+    assert matter_device.matter is not None
+    assert matter_device.device_id in topology.children(matter_device.matter.hub_id)
+
+
+def switch_event(device_id: str, value: str) -> DeviceEvent:
+    """Return a switch event for a device."""
+    event = load_json_fixture("event.json")["deviceEvent"]
+    return DeviceEvent.from_dict({**event, "deviceId": device_id, "value": value})
+
+
+def test_query() -> None:
+    """Test querying devices on their indexes and state."""
+    topology = Topology()
+    for device in DeviceResponse.from_json(load_fixture("devices_10.json")).items:
+        topology.add_device(device)
+    assert len(topology.query()) == 17
+    assert topology.query(location_id=LOCATION_ID, capability=Capability.SWITCH) == {
+        "6a6954ee-5784-4cce-aac6-fbe010adca07",
+        "b4d20b8f-ae23-8a6d-9db2-4c9d8db2c615",
+        "01751e21-3609-ec2f-41af-1c8bc8d96c15",
+    }
+    assert topology.query(
+        device_type=DeviceType.ZIGBEE,
+        manufacturer_category=Category.MOTION_SENSOR,
+    ) == {
+        "59513635-baa2-463f-bb6a-443f662f3f2a",
+        "3358b4cc-4a35-49ad-8bf9-95803d044408",
+    }
+    assert topology.query(room_id=ROOM_ID, category=Category.TELEVISION) == {
+        "01751e21-3609-ec2f-41af-1c8bc8d96c15"
+    }
+    assert not topology.query(user_category=Category.TELEVISION)
+    assert not topology.query(location_id="unknown", capability=Capability.SWITCH)
+
+    state = StateStore()
+    state.handle_event(switch_event("b4d20b8f-ae23-8a6d-9db2-4c9d8db2c615", "on"))
+    state.handle_event(switch_event("01751e21-3609-ec2f-41af-1c8bc8d96c15", "off"))
+    switched_on = Condition(Capability.SWITCH, Attribute.SWITCH, "on")
+    assert topology.query(
+        location_id=LOCATION_ID, conditions=[switched_on], state=state
+    ) == {"b4d20b8f-ae23-8a6d-9db2-4c9d8db2c615"}
+    assert topology.query(
+        conditions=[
+            Condition(
+                Capability.SWITCH,
+                Attribute.SWITCH,
+                predicate=lambda value: value in {"on", "off"},
+            )
+        ],
+        state=state,
+    ) == {
+        "b4d20b8f-ae23-8a6d-9db2-4c9d8db2c615",
+        "01751e21-3609-ec2f-41af-1c8bc8d96c15",
+    }
+    with pytest.raises(ValueError, match="state store is required"):
+        topology.query(conditions=[switched_on])